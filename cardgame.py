@@ -6,14 +6,17 @@ import arcade
 from arcade.future.light import Light, LightLayer
 import socket
 import threading
-import pickle
+import queue
 import json
 import time
 import numpy as np
 import random
 import arcade.gui
+import pyglet
 import pyperclip
 import ctypes
+import functools
+import operator
 from datetime import datetime
 import ctypes
 
@@ -23,25 +26,78 @@ warnings.filterwarnings("ignore", category=PerformanceWarning)
 
 # ──[ Parameters ]─────────────────────────────────────────────────────────────
 
-# Set consistent random seed
-# random.seed(42)
+# Consistent random card jitter (own generator, leaves the global random state alone)
+CARD_RNG = random.Random(42)
 
 # Game constants
 SCREEN_TITLE = 'Bridge: Card Game'
 PLAYER_POSITIONS = ["north", "east", "south", "west"]
 SUITS = ["clubs", "diamonds", "hearts", "spades", "notrump"]
 HCP = {'A': 4, 'K': 3, 'Q': 2, 'J': 1}
+SUIT_SYMBOLS = {
+    "clubs": "♣",
+    "diamonds": "♦", 
+    "hearts": "♥",
+    "spades": "♠",
+    "notrump": "NT",
+    None: ""
+}
 
 # Card constants
 CARD_VALUES = ["A", "K", "Q", "J", "T", "9", "8", "7", "6", "5", "4", "3", "2"]
 CARD_SUITS = ["diamonds", "clubs", "hearts", "spades"]
+CARD_LOCATIONS = ["deck", "table", "hand", "dummy", "tricks"]
 CARD_ENLARGE = 1.1
 
+# Card order lookups
+CARD_SUIT_ORDER = {suit: i for i, suit in enumerate(CARD_SUITS)}
+CARD_VALUE_ORDER = {value: i for i, value in enumerate(CARD_VALUES)}
+
 # Bidding constants
 BID_TYPES = ["pass", "double", "normal"]
 TILE_LEVELS = [1, 2, 3, 4, 5, 6, 7]
 TILE_SUITS = ["clubs", "diamonds", "hearts", "spades", "notrump"]
 
+# Bidding order lookups
+SUIT_ORDER = {suit: i for i, suit in enumerate(SUITS)}
+TILE_SUIT_INDEX = {suit: i for i, suit in enumerate(TILE_SUITS)}
+TILE_LEVEL_INDEX = {level: i for i, level in enumerate(TILE_LEVELS)}
+
+# Board position of every player seen from every bottom player
+DISPLAY_POSITIONS = {
+    (bottom_position, position): ["bottom", "left", "top", "right"][
+        (PLAYER_POSITIONS.index(position) - PLAYER_POSITIONS.index(bottom_position)) % 4
+    ]
+    for bottom_position in PLAYER_POSITIONS
+    for position in PLAYER_POSITIONS
+}
+
+# Playing order on the table for every player leading a trick
+TURN_ORDERS = {
+    leader: {
+        position: (i - PLAYER_POSITIONS.index(leader)) % 4
+        for i, position in enumerate(PLAYER_POSITIONS)
+    }
+    for leader in PLAYER_POSITIONS
+}
+
+# Hand fan per board side: origin as (width, height, card height) factors, slope and curvature
+# of x and y along the hand, angle spread and angle offset
+FAN_PARAMS = {
+    "bottom": ((0.5, 0, 0), 60, 0, (0, 0, 0.5), 0, -2.25, 60, 0),
+    "top": ((0.5, 0, 0), 40, 0, (0, 1, -0.125), 0, 3, -80, 0),
+    "left": ((0, 0, 0.125), 0, -3, (0, 0.5, 0), 40, 0, -80, -90),
+    "right": ((1, 0, -0.125), 0, 3, (0, 0.5, 0), 40, 0, 80, 90)
+}
+
+# Radial spread of a reviewed trick per board side: x and y direction, angle
+REVIEW_SPREAD = {
+    "bottom": (0, -1, 5),
+    "left": (-1, 0, -10),
+    "top": (0, 1, -5),
+    "right": (1, 0, 10)
+}
+
 # Lobby dimensions
 LOBBY_WIDTH = 1280
 LOBBY_HEIGHT = 720
@@ -50,6 +106,96 @@ LOBBY_SCALE = min(LOBBY_HEIGHT/1080, LOBBY_WIDTH/1920)
 
 # Visual appearance
 MAIN_COLOR = (17, 53, 65, 255)
+TILE_COLOR = (255, 255, 255, 0)
+TILE_COLOR_HOVER = (255, 255, 255, 80)
+BIDDING_WHITE = (255, 255, 255, 255)
+BIDDING_RED = (173, 54, 50, 255)
+BIDDING_BEIGE = (255, 204, 170, 255)
+
+
+
+# ──[ Assets ]─────────────────────────────────────────────────────────────────
+
+@functools.lru_cache(maxsize=None)
+def get_sound(path):
+    """ Load sound effect once and share it between all views """
+    
+    return arcade.load_sound(path)
+
+
+@functools.lru_cache(maxsize=None)
+def get_texture(path):
+    """ Decode texture once and share it between all sprites """
+    
+    return arcade.load_texture(path)
+
+
+@functools.lru_cache(maxsize=None)
+def get_cursor(window, cursor_type):
+    """ Fetch system mouse cursor once per window """
+    
+    return window.get_system_mouse_cursor(cursor_type)
+
+
+@functools.lru_cache(maxsize=None)
+def get_font(path):
+    """ Register font once per process """
+    
+    arcade.load_font(path)
+
+
+
+# ──[ Layout ]─────────────────────────────────────────────────────────────────
+
+@functools.lru_cache(maxsize=256)
+def fan_layout(rel_position, n, width, height, scale, card_height):
+    """ Positions and angles of a fanned hand with n cards """
+    
+    # Index as if cards would be in full hand (centered around zero)
+    max_cards = 13
+    t = np.arange(n) + (max_cards - n) / 2 - (max_cards - 1) / 2
+    
+    # Coefficients of this board side
+    x_origin, x_slope, x_curve, y_origin, y_slope, y_curve, spread, offset = FAN_PARAMS[rel_position]
+    
+    # Find positions and angles
+    x0 = x_origin[0] * width + x_origin[1] * height + x_origin[2] * card_height
+    y0 = y_origin[0] * width + y_origin[1] * height + y_origin[2] * card_height
+    x = x0 + (t * x_slope + np.square(t) * x_curve) * scale
+    y = y0 + (t * y_slope + np.square(t) * y_curve) * scale
+    angle = t / max_cards * spread + offset
+    
+    # Convert to plain floats for the sprites
+    positions = tuple(zip(x.tolist(), y.tolist()))
+    angles = tuple(angle.tolist())
+    
+    return positions, angles
+
+
+
+# ──[ Formatting ]─────────────────────────────────────────────────────────────
+
+@functools.lru_cache(maxsize=256)
+def format_state_value(value, width):
+    """ Dot-padded label of a contract/scoring value """
+    
+    # Set to "" if None
+    value = "TBD" if value is None else value
+    
+    # Transfrom to int (if a number, strings are kept as they are)
+    if not isinstance(value, str):
+        try:
+            value = int(value)
+        except (ValueError, TypeError):
+            pass
+    
+    # Transform to string
+    value = str(value)
+    
+    # Add dots
+    label = (" " + value).rjust(width, ".")
+    
+    return label.upper()
 
 
 
@@ -76,6 +222,13 @@ class Layout:
 
 class Card(arcade.Sprite):
     """ Card sprite """
+    
+    # Fixed attribute layout (no per-card __dict__)
+    __slots__ = (
+        "suit", "value", "facing", "owner", "location",
+        "trick", "hcp", "sort_key", "image",
+        "texture_up", "texture_down", "texture_wrapped"
+    )
 
     def __init__(self, suit, value, facing, owner, location, trick, scale=1):
         """ Card constructor """
@@ -88,24 +241,30 @@ class Card(arcade.Sprite):
         self.location = location # deck, table, hand, dummy, tricks
         self.trick = trick
         self.hcp = HCP.get(value, 0)
+        self.sort_key = CARD_SUIT_ORDER[suit]*16 + CARD_VALUE_ORDER[value]
 
         # Image to use for the sprite when face up
         self.image = f'assets/images/cards/card{self.suit}{self.value}.png'
         
+        # Textures for every facing (backs are shared by all cards)
+        self.texture_up = get_texture(self.image)
+        self.texture_down = get_texture(r'assets/images/cards/cardBack_red2.png')
+        self.texture_wrapped = get_texture(r'assets/images/cardBack_wrapped.png')
+        
         # Call the parent
-        super().__init__(self.image, scale, hit_box_algorithm="None")
+        super().__init__(self.texture_up, scale, hit_box_algorithm="None")
         
     def face_down(self):
         """ Turn card face-down """
-        self.texture = arcade.load_texture(r'assets/images/cards/cardBack_red2.png')
+        self.texture = self.texture_down
         
     def face_down_wrapped(self):
         """ Wraps card in band """
-        self.texture = arcade.load_texture(r'assets/images/cardBack_wrapped.png')
+        self.texture = self.texture_wrapped
         
     def face_up(self):
         """ Turn card face-up """
-        self.texture = arcade.load_texture(self.image)
+        self.texture = self.texture_up
 
 
 
@@ -118,6 +277,13 @@ class Tile(arcade.Sprite):
         self.level = level
         self.suit = suit
         self.type = bid_type
+        self.is_normal = bid_type == "normal"
+        
+        # Ordinal (strictly increasing) number of the bid
+        if level is None:
+            self.ordinal = -1
+        else:
+            self.ordinal = SUIT_ORDER[suit] + (level-1)*5
         
         # Image
         if bid_type == "normal":
@@ -144,12 +310,16 @@ class Tile(arcade.Sprite):
         
 class Bid:
     
+    # Fixed attribute layout (a full history is rebuilt on every state update)
+    __slots__ = ("player", "type", "level", "suit", "symbol")
+    
     def __init__(self, player, bid_type, level, suit):
         
         self.player = player
         self.type = bid_type
         self.level = level
         self.suit = suit
+        self.symbol = ""
         
         
         
@@ -170,6 +340,9 @@ class BoardElement(arcade.Sprite):
 class Player():
     """ Player class """
     
+    # Fixed attribute layout
+    __slots__ = ("name", "position", "team", "bid_suit", "bid_level", "bid_type")
+    
     def __init__(self, name, position):
         """ Player constructor """
         
@@ -214,13 +387,13 @@ class Game(arcade.View):
         self.background_color = MAIN_COLOR # arcade.color.ARSENIC
         
         # Sound effects
-        self.sound_slide = arcade.load_sound(r'assets/effects/slide.mp3')
-        self.sound_cash = arcade.load_sound(r'assets/effects/cash.mp3')
-        self.sound_drop = arcade.load_sound(r'assets/effects/drop.mp3')
-        self.sound_lock = arcade.load_sound(r'assets/effects/lock.mp3')
+        self.sound_slide = get_sound(r'assets/effects/slide.mp3')
+        self.sound_cash = get_sound(r'assets/effects/cash.mp3')
+        self.sound_drop = get_sound(r'assets/effects/drop.mp3')
+        self.sound_lock = get_sound(r'assets/effects/lock.mp3')
         
         # Fonts
-        arcade.load_font("assets/fonts/CourierNewBold.ttf")
+        get_font("assets/fonts/CourierNewBold.ttf")
         
         # Layout
         self.layout = Layout(self.window.width, self.window.height)
@@ -237,8 +410,15 @@ class Game(arcade.View):
         # Stack state when last trick was reviewed
         self.last_trick_state = None
         
+        # Server state the cards were last arranged for
+        self.layout_state = None
+        
+        # Game whose freshly dealt hands were last ordered
+        self.ordered_game = None
+        
         # Set bidding history
         self.bidding_history = []
+        self.bidding_runs = {position: () for position in PLAYER_POSITIONS}
         
         # Mouse position
         self.mouse_x = 0
@@ -300,19 +480,54 @@ class Game(arcade.View):
         # Hovered card
         self.hover_card = None
         
+        # Current mouse cursor
+        self.cursor_type = None
+        
         # Hovered tile
         self.hover_tile = None
         
+        # Hovered tile and contract the tiles were last colored for
+        self.tile_state = None
+        
+        # Text objects of all annotations
+        self.text_cache = {}
+        
+        # High card points of own hand
+        self.hcp_count = 0
+        
+        # Batch for the board annotations (drawn in one call)
+        self.annotation_batch = pyglet.graphics.Batch()
+        self.bidding_layouts = {}
+        
         # Thread
         self.running = True
+        
+        # Latest game state received but not yet applied (only the newest one matters)
+        self.state_lock = threading.Lock()
+        self.pending_state = None
+        
+        # Full game state merged from the server's delta messages
+        self.server_state = {}
 
-        # Create every card
-        for card_suit in CARD_SUITS:
-            for card_value in CARD_VALUES:
-                card = Card(card_suit, card_value, "up", None, None, self.layout.scale)
-                card.position = self.layout.width/2, self.layout.height/2
-                card.angle = random.uniform(-5, 5)
-                self.card_list.append(card)
+        # Create every card (textures are shared through get_texture)
+        cards = [
+            Card(card_suit, card_value, "up", None, None, None, self.layout.scale)
+            for card_suit in CARD_SUITS
+            for card_value in CARD_VALUES
+        ]
+        for card in cards:
+            card.position = self.layout.width/2, self.layout.height/2
+            card.angle = CARD_RNG.uniform(-5, 5)
+        self.card_list.extend(cards)
+                
+        # Map for fast card access (suit and value never change)
+        self.card_map = {(card.suit, card.value): card for card in self.card_list}
+                
+        # Group cards by location
+        self.group_cards()
+        
+        # Precompute hand geometry
+        self.prepare_fan_layouts()
                 
         # Create every normal tile
         for i, tile_suit in enumerate(TILE_SUITS):
@@ -337,6 +552,9 @@ class Game(arcade.View):
             player = Player(name, position)
             self.player_list.append(player)
             
+        # Map for fast player access (positions never change)
+        self.player_map = {player.position: player for player in self.player_list}
+            
         # Create board elements: Border 
         image_path = r'assets/images/board.border.png'
         self.board_border = BoardElement(image_path, self.layout.scale)
@@ -435,6 +653,14 @@ class Game(arcade.View):
         self.bidding_elements.append(self.bidding_strip_left)
         self.bidding_elements.append(self.bidding_strip_right)
         
+        # Bidding strip of every relative board position
+        self.bidding_strips = {
+            "bottom": self.bidding_strip_bottom,
+            "top": self.bidding_strip_top,
+            "left": self.bidding_strip_left,
+            "right": self.bidding_strip_right
+        }
+        
         # Create overlay elements: Card halo
         image_path = r'assets/images/card.halo.png'
         self.card_halo = BoardElement(image_path, self.layout.scale)
@@ -443,9 +669,14 @@ class Game(arcade.View):
         # Add to overlay element list
         self.cardoverlay_elements.append(self.card_halo)
         
+        # Precompute annotation geometry
+        self.prepare_annotations()
+        
         # Connect to socket
         try:
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
             self.socket.connect((self.host, self.port))
         except:
             print('No connection possible')
@@ -461,12 +692,18 @@ class Game(arcade.View):
             "player_position": self.player_position,
             "player_name": self.player_name
         }
-        self.socket.sendall(pickle.dumps(data))
+        payload = json.dumps(data).encode("utf-8")
+        self.socket.sendall(len(payload).to_bytes(4, "big") + payload)
         
         # Start thread to receive messages
         self.recv_thread = threading.Thread(target=self.receive_state, daemon=True)
         self.recv_thread.start()
         
+        # Start thread to send actions (keeps the render thread off the socket)
+        self.send_queue = queue.Queue()
+        self.send_thread = threading.Thread(target=self.send_actions, daemon=True)
+        self.send_thread.start()
+        
         
     def create_light(self):
         
@@ -523,14 +760,23 @@ class Game(arcade.View):
         # Rescale bidding tiles
         for tile in self.tile_list:
             if tile.type == "normal":
-                suit_index = TILE_SUITS.index(tile.suit)
-                level_index = TILE_LEVELS.index(tile.level)
+                suit_index = TILE_SUIT_INDEX[tile.suit]
+                level_index = TILE_LEVEL_INDEX[tile.level]
                 tile.set_position_by_index(suit_index, level_index, self.layout)
             else:
                 tile.set_position_by_index(0, 0, self.layout)
 
         # Rescale light source
         self.create_light()
+        
+        # Precompute hand geometry for new window size
+        self.prepare_fan_layouts()
+        
+        # Precompute annotation geometry for new window size
+        self.prepare_annotations()
+        
+        # Keep hovered card enlarged
+        self.scale_hover_card()
             
         # Reposition cards
         self.adjust_card_position()
@@ -540,44 +786,34 @@ class Game(arcade.View):
     def on_update(self, delta_time):
         """Update sprites. """
         
-        # Shrink previous enlarged card
-        for card in self.card_list:
-            if card != self.hover_card and card.scale != self.layout.scale:
-                card.scale = self.layout.scale
-            elif card.location != "hand" and card.scale != self.layout.scale:
-                card.scale = self.layout.scale
+        # Apply newest game state (at most once per frame)
+        with self.state_lock:
+            game_state = self.pending_state
+            self.pending_state = None
+        if game_state is not None:
+            self.update_state(game_state)
         
-        # Enlarge card we are hovering above
-        if (self.hover_card != None):
-            if self.hover_card.location == "hand":
-                self.hover_card.scale = self.layout.scale*CARD_ENLARGE
-                
-        # Adjust card facing
-        for card in self.card_list:
-            if card.facing == "down":
-                card.face_down()
-            elif card.facing == "wrapped":
-                card.face_down_wrapped()
-            else:
-                card.face_up()
-                
-        # Reset highlighted tile
-        for tile in self.tile_list:
-            if tile != self.hover_tile:
-                tile.color = [255, 255, 255, 0]
-                
-        # Highlight tile we are hovering above
-        if (self.hover_tile != None):
-            self.hover_tile.color = [255, 255, 255, 80]
-            
         # Get ordinal of current contract
         contract_ordinal = self.get_bid_ordinal(self.contract_level, self.contract_suit)
         
-        # Grey out tile that are no longer biddable
+        # Recolor tiles only if hovered tile or contract changed
+        tile_state = (self.hover_tile, contract_ordinal)
+        if tile_state == self.tile_state:
+            return
+        self.tile_state = tile_state
+        
         for tile in self.tile_list:
-            bid_ordinal = self.get_bid_ordinal(tile.level, tile.suit)
-            if bid_ordinal <= contract_ordinal and tile.type == "normal":
-                tile.color = MAIN_COLOR
+            # Grey out tile that are no longer biddable
+            if tile.is_normal and tile.ordinal <= contract_ordinal:
+                color = MAIN_COLOR
+            # Highlight tile we are hovering above
+            elif tile == self.hover_tile:
+                color = TILE_COLOR_HOVER
+            # Reset highlighted tile
+            else:
+                color = TILE_COLOR
+            if tile.color != color:
+                tile.color = color
         
                 
         
@@ -610,9 +846,6 @@ class Game(arcade.View):
             # Texture overlay
             self.texture_elements.draw()
             
-            # Color cards
-            self.color_cards()
-            
             # Draw the cards
             self.card_list.draw()
             
@@ -625,7 +858,7 @@ class Game(arcade.View):
     def review_trick(self, held_card):
         
         # Get cards on trick pile
-        tricks = [card for card in self.card_list if card.location == "tricks"]
+        tricks = self.cards_by_location["tricks"]
         
         # Check if any tricks
         if len(tricks) == 0:
@@ -649,12 +882,16 @@ class Game(arcade.View):
 
 
         
-    def pull_to_top(self, card: arcade.Sprite):
-        """ Pull card to top of rendering order (last to render, looks on-top) """
-
-        # Remove, and append to the end
-        self.card_list.remove(card)
-        self.card_list.append(card)
+    def pull_to_top(self, cards: list):
+        """ Pull cards to top of rendering order (last to render, looks on-top) """
+        
+        # Nothing to do if cards are already on top in this order
+        if len(cards) == 0 or self.card_list[-len(cards):] == cards:
+            return
+        
+        # Single stable sort instead of removing and re-adding every card
+        draw_order = {card: i for i, card in enumerate(cards)}
+        self.card_list.sort(key=lambda card: draw_order.get(card, -1))
 
     def on_mouse_press(self, x, y, button, key_modifiers):
         """ Called when the user presses a mouse button. """
@@ -745,10 +982,7 @@ class Game(arcade.View):
         }
         
         # Send action to server
-        try:
-            self.socket.sendall(pickle.dumps(action))
-        except Exception as e:
-            print(f"Error sending to server: {e}")
+        self.send_queue.put(action)
         
         # Play sound
         self.play_sound("lock")
@@ -760,7 +994,7 @@ class Game(arcade.View):
         if bid_level is None:
             ordinal = -1
         else:
-            ordinal = SUITS.index(bid_suit) + (bid_level-1)*5
+            ordinal = SUIT_ORDER[bid_suit] + (bid_level-1)*5
        
         return(ordinal)
         
@@ -774,23 +1008,20 @@ class Game(arcade.View):
         self.mouse_x = x
         self.mouse_y = y
         
-        # Get cards on table
-        table = [card for card in self.card_list if card.location == "table"]
-        
-        # Get cards on trick pile
-        tricks = [card for card in self.card_list if card.location == "tricks"]
-        
         # Get list of cards we'are hovering above
         cards = arcade.get_sprites_at_point((x, y), self.card_list)
         
         # Declare top card as hovered card
         if len(cards) > 0:
-            self.hover_card = cards[-1]
+            self.set_hover_card(cards[-1])
         else:
-            self.hover_card = None
+            self.set_hover_card(None)
             
-        # Get list of tiles we'are hovering above
-        tiles = arcade.get_sprites_at_point((x, y), self.tile_list)
+        # Get list of tiles we'are hovering above (only shown while bidding)
+        if self.game_phase == "bidding":
+            tiles = arcade.get_sprites_at_point((x, y), self.tile_list)
+        else:
+            tiles = []
         
         # Declare top tile as hovered tile
         if len(tiles) > 0:
@@ -800,33 +1031,38 @@ class Game(arcade.View):
         
         # Set cursor type to default
         cursor_type = self.window.CURSOR_DEFAULT
-                
-        # Set cursor type to "hand" if hovering card above hand card
+        
+        # Check hovered card
         if len(cards) > 0:
-            if cards[-1].location == "hand" and cards[-1].owner == self.player_position:
-                cursor_type = self.window.CURSOR_HAND
-                
-        # Check if it is player's turn (or player's dummy) to take a trick
-        player_turn = True
-        if self.current_turn != self.player_position:
-            if not (
-                self.current_turn == self.dummy_position 
-                and self.player_position == self.declarer_position
-            ):
-                player_turn = False
+            card = cards[-1]
+            
+            # Get cards on table
+            table = self.cards_by_location["table"]
+            
+            # Get cards on trick pile
+            tricks = self.cards_by_location["tricks"]
                 
-        # Set cursor type to "hand" if hovering card above trick ready to take
-        if len(cards) > 0 and player_turn:
-            if len(table) == 4 and cards[-1].location == "table":
+            # Set cursor type to "hand" if hovering card above hand card
+            if card.location == "hand" and card.owner == self.player_position:
                 cursor_type = self.window.CURSOR_HAND
-                
-        # Set cursor type to "hand" if hovering over a card of the last trick taken
-        if len(cards) > 0 and len(tricks) > 0:
-            if cards[-1] == tricks[-1]:
+                    
+            # Set cursor type to "hand" if hovering card above trick ready to take
+            # (on player's turn or player's dummy's turn)
+            elif card.location == "table" and len(table) == 4:
+                if self.current_turn == self.player_position or (
+                    self.current_turn == self.dummy_position 
+                    and self.player_position == self.declarer_position
+                ):
+                    cursor_type = self.window.CURSOR_HAND
+                    
+            # Set cursor type to "hand" if hovering over a card of the last trick taken
+            elif len(tricks) > 0 and card == tricks[-1]:
                 cursor_type = self.window.CURSOR_HAND
                 
-        # Set cursor
-        self.window.set_mouse_cursor(self.window.get_system_mouse_cursor(cursor_type))
+        # Set cursor (only if changed)
+        if cursor_type != self.cursor_type:
+            self.cursor_type = cursor_type
+            self.window.set_mouse_cursor(get_cursor(self.window, cursor_type))
                 
         
     def on_key_press(self, key, _modifiers):
@@ -845,13 +1081,14 @@ class Game(arcade.View):
             # Send action to server
             action = {"type": "leave_game"}
             
-            # Disconnect
+            # Disconnect (after all queued actions went out)
+            self.send_queue.put(action)
+            self.send_queue.put(None)
+            self.send_thread.join(timeout=1)
             try:
-                self.socket.sendall(pickle.dumps(action))
+                self.socket.shutdown(socket.SHUT_RDWR)
             except Exception:
                 pass
-            finally:
-                self.socket.shutdown(socket.SHUT_RDWR)
                 
             # De-maximize window
             hwnd = self.window._hwnd
@@ -884,10 +1121,7 @@ class Game(arcade.View):
         }
         
         # Send action to server
-        try:
-            self.socket.sendall(pickle.dumps(action))
-        except Exception as e:
-            print(f"Error sending to server: {e}")
+        self.send_queue.put(action)
             
             
             
@@ -898,37 +1132,80 @@ class Game(arcade.View):
         action = {"type": "take_trick"}
         
         # Send action to server
-        try:
-            self.socket.sendall(pickle.dumps(action))
-        except Exception as e:
-            print(f"Fehler beim Serialisieren der Aktion: {e}")
+        self.send_queue.put(action)
             
             
 
     def order_hand(self):
         """Order cards in hand by suit and value"""
         
-        self.card_list.sort(key=lambda card: (CARD_SUITS.index(card.suit), CARD_VALUES.index(card.value)))
+        self.card_list.sort(key=operator.attrgetter("sort_key"))
 
 
+    def send_actions(self):
+        """Send queued actions to server"""
+        
+        while True:
+            action = self.send_queue.get()
+            
+            # Stop on sentinel
+            if action is None:
+                break
+            
+            # Send with 4-byte big-endian length prefix
+            try:
+                payload = json.dumps(action).encode("utf-8")
+                self.socket.sendall(len(payload).to_bytes(4, "big") + payload)
+            except Exception as e:
+                print(f"Error sending to server: {e}")
+                
+                
     def receive_state(self):
         """Receive game state from server"""
         
+        # Bytes received but not yet decoded (messages may be split or merged by TCP)
+        buffer = bytearray()
+        
         while self.running:
             try:
-                data = self.socket.recv(4096)
-                self.update_state(data)
+                chunk = self.socket.recv(65536)
+                if not chunk:
+                    print("Connection lost")
+                    break
+                buffer += chunk
+                
+                # Dispatch every complete message (4-byte big-endian length prefix)
+                while len(buffer) >= 4:
+                    size = int.from_bytes(buffer[:4], "big")
+                    if len(buffer) < 4 + size:
+                        break
+                    data = bytes(buffer[4:4 + size])
+                    del buffer[:4 + size]
+                    self.receive_message(data)
             except:
                 print("Connection lost")
                 time.sleep(0.1)
                 continue
                 
             
-    def update_state(self, data):
-        """Update game state from server data"""
+    def receive_message(self, data):
+        """Decode game state and leave it for the next frame"""
+        
+        # Load changed fields (the first message holds the full state)
+        message = json.loads(data)
+        self.server_state.update(message)
+        
+        # Play sound (every event, even if the state itself gets superseded)
+        sound = message.get("sound")
+        self.play_sound(sound)
         
-        # Load game state
-        game_state = pickle.loads(data)
+        # Replace any state that has not been applied yet
+        with self.state_lock:
+            self.pending_state = dict(self.server_state)
+            
+            
+    def update_state(self, game_state):
+        """Update game state from server data"""
         
         # Update game state variables
         self.game_phase = game_state.get("game_phase")
@@ -945,21 +1222,14 @@ class Game(arcade.View):
         self.dummy_position = game_state.get("dummy_position")
         self.declarer_position = game_state.get("declarer_position")
         
-        # Play sound
-        sound = game_state.get("sound")
-        self.play_sound(sound)
-        
         # Get player/bot info
         player_list = game_state.get("players")
         
-        # Setup map for fast access
-        player_map = {player.position: player for player in self.player_list}
-        
         # Update player variables with clients
         for server_player in player_list:
             # Get player
             position = server_player["position"]
-            player = player_map[position]
+            player = self.player_map[position]
             # Fill in attributes
             player.name = server_player["name"]
             player.team = server_player["team"]
@@ -967,29 +1237,44 @@ class Game(arcade.View):
             player.bid_level = server_player["bid_level"]
             player.bid_type = server_player["bid_type"]
             
-        # Get logical card variables
+        # Get logical card variables (suit, value, facing, location, owner, trick)
         logical_card_list = game_state.get("cards")
         
-        # Setup map for fast access
-        card_map = {(card.suit, card.value): card for card in self.card_list}
-        
-        # Update card variables
-        for logical_card in logical_card_list:
-            key = (logical_card["suit"], logical_card["value"])
-            if key in card_map:
-                card = card_map[key]
-                card.facing = logical_card["facing"]
-                card.owner = logical_card["owner"]
-                card.location = logical_card["location"]
-                card.trick = logical_card["trick"]
-
-        # Update card position
-        self.adjust_card_position()
+        # Everything the card layout depends on
+        layout_state = (
+            self.game_phase, self.original_turn, self.dummy_position, self.contract_suit,
+            tuple(map(tuple, logical_card_list))
+        )
         
-        # Reorder cards after new draw
-        hand_count = sum(1 for card in self.card_list if card.location == "hand")
-        if hand_count == 52:
-            self.order_hand()
+        # Only rearrange cards if something changed (most updates are bids or sounds)
+        if layout_state != self.layout_state:
+            self.layout_state = layout_state
+            
+            # Update card variables
+            for suit, value, facing, location, owner, trick in logical_card_list:
+                key = (suit, value)
+                if key in self.card_map:
+                    card = self.card_map[key]
+                    # Only write what the server actually changed
+                    if card.facing != facing:
+                        card.facing = facing
+                    if card.owner != owner:
+                        card.owner = owner
+                    if card.location != location:
+                        card.location = location
+                    if card.trick != trick:
+                        card.trick = trick
+                        
+            # High card points of own hand (only changes with the cards)
+            self.hcp_count = sum(card.hcp for card in self.card_list if card.owner == self.player_position)
+                        
+            # Reorder cards once after new draw (every deal starts with bidding)
+            if self.game_phase == "bidding" and self.current_game != self.ordered_game:
+                self.ordered_game = self.current_game
+                self.order_hand()
+    
+            # Update card position
+            self.adjust_card_position()
             
         # Clear bidding history
         self.bidding_history.clear()
@@ -1002,8 +1287,12 @@ class Game(arcade.View):
                 level=bid_info["level"],
                 suit=bid_info["suit"]
             )
+            bid.symbol = self.convert_bid_to_symbol(bid)
             self.bidding_history.append(bid)
             
+        # Build bidding texts of all players
+        self.group_bids()
+            
             
 
     def play_sound(self, sound):
@@ -1031,6 +1320,9 @@ class Game(arcade.View):
             self.bid_suit = None
             self.bid_type = None
             
+        # Group cards by location
+        self.group_cards()
+            
         # Order cards in different locations
         self.arrange_player_cards()
         self.arrange_stack_cards()
@@ -1038,15 +1330,85 @@ class Game(arcade.View):
         self.arrange_table_cards()
         self.arrange_dummy_cards()
         
+        # Flip and highlight cards once facing and contract are settled
+        self.color_cards()
+        
+        # Hovered card might have left the hand
+        self.scale_hover_card()
+        
+    def prepare_fan_layouts(self):
+        """Precompute hand geometry for every position and hand size"""
+        
+        for rel_position in ("bottom", "left", "top", "right"):
+            for n in range(1, 14):
+                fan_layout(
+                    rel_position, n,
+                    self.layout.width, self.layout.height,
+                    self.layout.scale, self.layout.card_height
+                )
+        
+    def prepare_annotations(self):
+        """Precompute annotation positions for the current window"""
+        
+        width = self.layout.width
+        height = self.layout.height
+        scale = self.layout.scale
+        card_height = self.layout.card_height
+        
+        # Name position next to the hand (inside) and at the board edge (outside), angle and dodge direction
+        name_slots = {
+            "bottom": ((width/2, card_height/8*9), (width/2, 30*scale), 0, (0, 1)),
+            "left": ((card_height/4*3, height/2), (30*scale, height/2), -90, (1, 0)),
+            "top": ((width/2, height - card_height/4*3), (width/2, height - 30*scale), 0, (0, -1)),
+            "right": ((width - card_height/4*3, height/2), (width - 30*scale, height/2), 90, (-1, 0))
+        }
+        
+        # Name and position label coordinates per player: {is_outside: (name_xy, label_xy)}, angle
+        self.name_positions = {}
+        for position in PLAYER_POSITIONS:
+            rel_position = self.get_display_position(self.player_position, position)
+            inside, outside, angle, dodge = name_slots[rel_position]
+            self.name_positions[position] = ({
+                is_outside: ((x, y), (x + dodge[0]*30*scale, y + dodge[1]*30*scale))
+                for is_outside, (x, y) in ((False, inside), (True, outside))
+            }, angle)
+        
+        # Contract and scoring board rows
+        contract_x = self.board_contract.right - 55*scale
+        scoring_x = self.board_scoring.right - 55*scale
+        self.board_positions = {
+            "contract_team": (contract_x, self.board_contract.bottom + 175*scale),
+            "contract_bid": (contract_x, self.board_contract.bottom + 120*scale),
+            "contract_doubled": (contract_x, self.board_contract.bottom + 65*scale),
+            "scoring_points": (scoring_x, self.board_scoring.bottom + 175*scale),
+            "scoring_games": (scoring_x, self.board_scoring.bottom + 120*scale),
+            "scoring_vulnerability": (scoring_x, self.board_scoring.bottom + 65*scale)
+        }
+        
+    def group_cards(self):
+        """Group cards by location, hand and trick pile in a single pass"""
+        
+        # Init groups (keeping the drawing order within each group)
+        self.cards_by_location = {location: [] for location in CARD_LOCATIONS}
+        self.cards_by_hand = {position: [] for position in PLAYER_POSITIONS}
+        self.cards_by_trick = {}
+        
+        # Sort every card into its groups
+        for card in self.card_list:
+            if card.location not in self.cards_by_location:
+                continue
+            self.cards_by_location[card.location].append(card)
+            if card.location == "hand":
+                self.cards_by_hand[card.owner].append(card)
+            elif card.location == "tricks":
+                self.cards_by_trick.setdefault(card.trick, []).append(card)
+        
     def arrange_player_cards(self):
         """Order cards in player's hand"""
 
         for position in ("south", "north", "west", "east"):
             # Get cards of that hand
-            hand = [
-                card for card in self.card_list 
-                if card.owner == position and card.location == "hand"
-            ]
+            hand = self.cards_by_hand[position]
             
             # Check if there are any cards in the hand
             n = len(hand)
@@ -1055,88 +1417,69 @@ class Game(arcade.View):
             
             # Get relative board position of that player (relative to this player)
             rel_position = self.get_display_position(self.player_position, position)
+            
+            # Only own cards are shown face up (all cards of a hand share the owner)
+            facing = "up" if position == self.player_position else "down"
     
-            # Offset
-            max_cards = 13
-            offset = (max_cards - n) / 2
-    
-            for i, card in enumerate(hand):
-                
-                # Index as if card would be in full hand
-                virtual_i = i + offset
-                t = (virtual_i - (max_cards - 1) / 2)
+            # Get positions and angles of the whole hand (cached per hand size)
+            positions, angles = fan_layout(
+                rel_position, n,
+                self.layout.width, self.layout.height,
+                self.layout.scale, self.layout.card_height
+            )
     
-                # Find position and angle
-                if rel_position == "bottom":
-                    x = self.layout.width / 2 + t * 60 * self.layout.scale
-                    y = self.layout.card_height / 2 - abs(t) ** 2 * 2.25 * self.layout.scale
-                    angle = t / max_cards * 60  
-                elif rel_position == "top":
-                    x = self.layout.width/2 + t * 40 * self.layout.scale
-                    y = self.layout.height - self.layout.card_height/8 + abs(t) ** 2 * 3 * self.layout.scale
-                    angle = -t / max_cards * 80
-                elif rel_position == "left":
-                    x = self.layout.card_height/8 - abs(t) ** 2 * 3 * self.layout.scale
-                    y = self.layout.height/2 + t * 40 * self.layout.scale
-                    angle = (-t / max_cards * 80) - 90
-                elif rel_position == "right":
-                    x = self.layout.width - self.layout.card_height/8 + abs(t) ** 2 * 3 * self.layout.scale
-                    y = self.layout.height/2 + t * 40 * self.layout.scale
-                    angle = (t / max_cards * 80) + 90
+            for card, position_xy, angle in zip(hand, positions, angles):
     
-                # Set position and angle
-                card.position = (x, y)
+                # Set position, angle and facing
+                card.position = position_xy
                 card.angle = angle
-                
-                # Set facing and size
-                if self.player_position != card.owner:
-                    card.facing = "down"
-                else:
-                    card.facing = "up"
+                card.facing = facing
             
     def arrange_table_cards(self):
         """Order cards on table"""
         
         # Get cards on table
-        table = [card for card in self.card_list if card.location == "table"]
+        table = self.cards_by_location["table"]
+        
+        # Check if any cards on table
+        if len(table) == 0:
+            return
+        
+        # Table slot (x, y, angle) of every relative board position
+        center_x = self.layout.width/2
+        center_y = self.layout.height/2
+        table_slots = {
+            "bottom": (center_x, center_y - self.layout.card_height*0.6, 7),
+            "left": (center_x - self.layout.card_width*0.6, center_y, -30),
+            "top": (center_x, center_y + self.layout.card_height*0.6, -5),
+            "right": (center_x + self.layout.card_width*0.6, center_y, 40)
+        }
+        
+        # Calculate dummy offset (the same for all cards)
+        dummy_offsets = {
+            "bottom": self.layout.card_height/4,
+            "top": -self.layout.card_height/4
+        }
+        dummy_offset = 0
+        if self.dummy_position is not None:
+            dummy_position = self.get_display_position(self.player_position, self.dummy_position)
+            dummy_offset = dummy_offsets.get(dummy_position, 0)
         
         # Order cards on table [horizontally]
         for card in table:
             # Get relative board position of that owner (relative to this player)
             rel_owner = self.get_display_position(self.player_position, card.owner)
-            if rel_owner == 'bottom':
-                card.position = self.layout.width/2, self.layout.height/2 - self.layout.card_height*0.6
-                card.angle = 7
-            elif rel_owner == 'left':
-                card.position = self.layout.width/2 - self.layout.card_width*0.6, self.layout.height/2
-                card.angle = -30
-            elif rel_owner == 'top':
-                card.position = self.layout.width/2, self.layout.height/2+ self.layout.card_height*0.6
-                card.angle = -5
-            else:
-                card.position = self.layout.width/2 + self.layout.card_width*0.6, self.layout.height/2
-                card.angle = 40
-            # Calculate dummy offset
-            dummy_position = self.get_display_position(self.player_position, self.dummy_position)
-            if dummy_position == "bottom":
-                card.center_y += self.layout.card_height/4
-            elif dummy_position == "top":
-                card.center_y -= self.layout.card_height/4
-            else:
-                pass
+            x, y, angle = table_slots[rel_owner]
+            card.position = x, y + dummy_offset
+            card.angle = angle
                 
         # Order cards on table [vertically]
-        current_index = PLAYER_POSITIONS.index(self.original_turn)  # <== statt self.current_turn
         # Sort by player position (clockwise from original turn)
-        sorted_positions = PLAYER_POSITIONS[current_index:] + PLAYER_POSITIONS[:current_index]
-        # Build sort order dict
-        sort_order = {pos: i for i, pos in enumerate(sorted_positions)}
+        sort_order = TURN_ORDERS[self.original_turn]
         # Sort cards on table accordingly
         table.sort(key=lambda card: sort_order.get(card.owner, 999))
         # Update drawing order
-        for card in table:
-            self.card_list.remove(card)
-            self.card_list.append(card)
+        self.pull_to_top(table)
             
 
             
@@ -1144,32 +1487,27 @@ class Game(arcade.View):
         """Order cards in trick stacks"""
         
         # Order cards on stack
-        stack_team = [
-            card for card in self.card_list 
-            if card.location == "tricks" 
-            and card.trick == self.team
-        ]
+        stack_team = self.cards_by_trick.get(self.team, [])
         stack_opponent = [
-            card for card in self.card_list 
-            if card.location == "tricks" 
-            and card.trick != self.team
+            card for card in self.cards_by_location["tricks"] 
+            if card.trick != self.team
         ]
         sets = [(stack_team, self.board_tricks_won), (stack_opponent, self.board_tricks_lost)]
         for stack, board in sets:
+            # Stack origin and offset between tricks
+            base_x = board.left + self.layout.card_height/2
+            base_y = board.bottom + self.layout.card_width/2 + 50*self.layout.scale
+            step = 26*self.layout.scale
+            # Wrap the oldest tricks of long stacks
+            wrapped = 24 if len(stack) > 20 else 0
             for i, card in enumerate(stack):
                 card.angle = 0
-                card.facing = "down"
-                batch = int(np.floor(i/4))
-                if len(stack) <= 20:
-                    x = board.left + self.layout.card_height/2 + batch*26*self.layout.scale
+                if i < wrapped:
+                    card.facing = "wrapped"
+                    card.position = base_x, base_y
                 else:
-                    if i < 24:
-                        x = board.left + self.layout.card_height/2
-                        card.facing = "wrapped"
-                    else:
-                        x = board.left + self.layout.card_height/2 + batch*26*self.layout.scale
-                y = board.bottom + self.layout.card_width/2 + 50*self.layout.scale
-                card.position = x, y
+                    card.facing = "down"
+                    card.position = base_x + (i // 4)*step, base_y
             
             
     
@@ -1179,7 +1517,7 @@ class Game(arcade.View):
             return
         
         # Get cards on trick pile
-        tricks = [card for card in self.card_list if card.location == "tricks"]
+        tricks = self.cards_by_location["tricks"]
         
         # Check if any tricks
         if len(tricks) == 0:
@@ -1193,106 +1531,144 @@ class Game(arcade.View):
         # Get last trick
         last_trick = tricks[-4:]
         
+        # Get relative position of every card owner (once per card)
+        rel_positions = {
+            card: self.get_display_position(self.player_position, card.owner)
+            for card in last_trick
+        }
+        
         # Sort display order
         position_priority = {"left": 0, "top": 1, "right": 2, "bottom": 3}
-        sorted_last_trick = sorted(
-            last_trick,
-            key=lambda c: position_priority[self.get_display_position(self.player_position, c.owner)]
-        )
+        sorted_last_trick = sorted(last_trick, key=lambda c: position_priority[rel_positions[c]])
+        
+        # Offset of radial spread
+        offset = 50 * self.layout.scale
         
         # Turn cards face up and move them radially
         for card in sorted_last_trick:
             
-            # Get relative position of card owner
-            rel_position = self.get_display_position(self.player_position, card.owner)
-            
-            # Offset
-            offset_x = 50 * self.layout.scale
-            offset_y = 50 * self.layout.scale
+            # Spread direction of card owner
+            dx, dy, angle = REVIEW_SPREAD[rel_positions[card]]
             
             # Set new position for radial spread
-            if rel_position == "bottom":
-                card.center_y -= offset_y
-                card.angle = 5
-            elif rel_position == "left":
-                card.center_x -= offset_x
-                card.angle = -10
-            elif rel_position == "top":
-                card.center_y += offset_y
-                card.angle = -5
-            elif rel_position == "right":
-                card.center_x += offset_x
-                card.angle = 10
+            card.center_x += dx * offset
+            card.center_y += dy * offset
+            card.angle = angle
                             
-            # Pull to top
-            self.pull_to_top(card)
-
             # Turn card face up
             card.facing = "up"
             
+        # Pull to top
+        self.pull_to_top(sorted_last_trick)
+        
+        # Keep trick pile in drawing order
+        tricks[-4:] = sorted_last_trick
+            
             
             
     def arrange_dummy_cards(self):
         """Order cards in dummy"""
         
-        # Get cards in dummy's hand
-        dummy_cards = [
-            card for card in self.card_list 
-            if card.owner == self.dummy_position
-            and card.location == "hand"
-        ]
-        
-        # Get cards in hand
-        hand_cards = [card for card in self.card_list if card.location == "hand"]
-        
         # Check if game phase is playing
         if self.game_phase != "playing":
             return
         
         # Check if first card is already played
-        if len(hand_cards) == 52:
+        if len(self.cards_by_location["hand"]) == 52:
             return
+        
+        # Get cards in dummy's hand
+        dummy_cards = self.cards_by_hand.get(self.dummy_position, [])
+        
+        # Get a stack of card for each suit (single pass)
+        suit_stacks = {suit: [] for suit in CARD_SUITS}
+        for card in dummy_cards:
+            suit_stacks[card.suit].append(card)
+            
+        # Get relative board position of dummy
+        dummy_position = self.get_display_position(self.player_position, self.dummy_position)
+
+        # Vertical start and direction of the stacks
+        step = self.layout.card_height/5
+        if dummy_position in ("left", "right"):
+            base_y = self.layout.height/3*2 - self.layout.card_height/2
+            step = -step
+        elif dummy_position == "top":
+            base_y = self.layout.height - 60*self.layout.scale - self.layout.card_height/2
+            step = -step
+        else:
+            base_y = 60*self.layout.scale + self.layout.card_height/2
 
         # Position cards by suit
         for suit_index, suit in enumerate(CARD_SUITS):
-            # Get a stack of card for each suit
-            suit_cards = [card for card in dummy_cards if card.suit == suit]
+            # Calculate horizontal position based on suit
+            if dummy_position == "left":
+                x = 60*self.layout.scale + (2*suit_index+1)/2*self.layout.card_width + suit_index*10*self.layout.scale
+            elif dummy_position == "right":
+                x = self.layout.width - 60*self.layout.scale - (2*(3-suit_index)+1)/2*self.layout.card_width - (3-suit_index)*10*self.layout.scale
+            else:
+                x = self.layout.width/2 + ((2*suit_index+1)/2 - 2)*self.layout.card_width + (suit_index*10 - 15)*self.layout.scale
             # Iterate through each stack
-            for card_index, card in enumerate(suit_cards):
-                # Calculate horizontal and vertical position based on suit
-                dummy_position = self.get_display_position(self.player_position, self.dummy_position)
-                if dummy_position == "left":
-                    x = 60*self.layout.scale + (2*suit_index+1)/2*self.layout.card_width + suit_index*10*self.layout.scale
-                    y = self.layout.height/3*2 - self.layout.card_height/2 - card_index*self.layout.card_height/5
-                elif dummy_position == "right":
-                    x = self.layout.width - 60*self.layout.scale - (2*(3-suit_index)+1)/2*self.layout.card_width - (3-suit_index)*10*self.layout.scale
-                    y = self.layout.height/3*2 - self.layout.card_height/2 - card_index*self.layout.card_height/5
-                elif dummy_position == "top":
-                    x = self.layout.width/2 + ((2*suit_index+1)/2 - 2)*self.layout.card_width + (suit_index*10 - 15)*self.layout.scale
-                    y = self.layout.height - 60*self.layout.scale - self.layout.card_height/2 - card_index*self.layout.card_height/5
-                else:
-                    x = self.layout.width/2 + ((2*suit_index+1)/2 - 2)*self.layout.card_width + (suit_index*10 - 15)*self.layout.scale
-                    y = 60*self.layout.scale + self.layout.card_height/2 + card_index*self.layout.card_height/5
+            for card_index, card in enumerate(suit_stacks[suit]):
+                # Calculate vertical position based on rank in suit
+                y = base_y + card_index*step
                 card.position = x, y
                 card.angle = 0
                 card.facing = "up"
                 
                 
                 
+    def set_hover_card(self, card):
+        """Shrink previously hovered card and enlarge the new one"""
+        
+        # Nothing to do if still hovering the same card
+        if card is self.hover_card:
+            return
+        
+        # Shrink previous enlarged card
+        if self.hover_card is not None:
+            self.hover_card.scale = self.layout.scale
+            
+        # Enlarge card we are hovering above
+        self.hover_card = card
+        self.scale_hover_card()
+        
+    def scale_hover_card(self):
+        """Enlarge hovered card only while it is in a hand"""
+        
+        if self.hover_card is None:
+            return
+        
+        if self.hover_card.location == "hand":
+            self.hover_card.scale = self.layout.scale*CARD_ENLARGE
+        else:
+            self.hover_card.scale = self.layout.scale
+        
     def color_cards(self):
-        """Color cards"""
+        """Flip and color cards in a single pass (called on state changes, not every frame)"""
         
-        # Highlight trump cards
         for card in self.card_list:
+            
+            # Adjust card facing
+            if card.facing == "down":
+                card.face_down()
+            elif card.facing == "wrapped":
+                card.face_down_wrapped()
+            else:
+                card.face_up()
+            
+            # Highlight trump cards
             if card.suit == self.contract_suit and card.facing == "up":
-                card.color = arcade.color.ANTIQUE_WHITE
+                color = arcade.color.ANTIQUE_WHITE
             else:
-                card.color = arcade.color.WHITE
+                color = arcade.color.WHITE
+            if card.color != color:
+                card.color = color
                 
     def draw_card_overlay(self):
         
         # Get cards on table
-        table = [card for card in self.card_list if card.location == "table"]
+        table = self.cards_by_location["table"]
         
         # Check if trick is complete
         if len(table) != 4:
@@ -1327,15 +1703,14 @@ class Game(arcade.View):
         
         # HCP overlay
         if self.game_phase == "bidding":
-            hcp_count = sum(card.hcp for card in self.card_list if card.owner == self.player_position)
-            label = str(hcp_count) + " HCP"
+            label = str(self.hcp_count) + " HCP"
             x = self.hcp_overlay.center_x
             y = self.hcp_overlay.center_y
-            text = self.annotate_text(label, x, y, 0, 18)
+            text = self.annotate_text("hcp", label, x, y, 0, 18)
             text.draw()
             
         # Number of cards in hands
-        hand_cards = sum(1 for card in self.card_list if card.location == "hand")
+        hand_cards = len(self.cards_by_location["hand"])
         
         # Player names
         for player in self.player_list:
@@ -1349,30 +1724,9 @@ class Game(arcade.View):
             # Set name drawing to the outside
             is_outside = is_dummy or is_dealing
             
-            # Get relative board position
-            rel_position = self.get_display_position(self.player_position, player.position)
-            
-            # Define annotation position
-            if rel_position == 'bottom':
-                x = self.layout.width / 2
-                y = 30 * self.layout.scale if is_outside else self.layout.card_height / 8 * 9
-                a = 0
-                dodge = [0, 1]
-            elif rel_position == 'left':
-                x = 30 * self.layout.scale if is_outside else self.layout.card_height / 4 * 3
-                y = self.layout.height / 2
-                a = -90
-                dodge = [1, 0]
-            elif rel_position == 'top':
-                x = self.layout.width / 2
-                y = self.layout.height - 30 * self.layout.scale if is_outside else self.layout.height - self.layout.card_height / 4 * 3
-                a = 0
-                dodge = [0, -1]
-            else:  # 'right'
-                x = self.layout.width - 30 * self.layout.scale if is_outside else self.layout.width - self.layout.card_height / 4 * 3
-                y = self.layout.height / 2
-                a = 90
-                dodge = [-1, 0]
+            # Get annotation position (precomputed per window size)
+            slots, a = self.name_positions[player.position]
+            (x, y), (label_x, label_y) = slots[is_outside]
                 
             # Add turn indication marks
             if player.position == self.current_turn:
@@ -1381,15 +1735,11 @@ class Game(arcade.View):
                 label = player.name.upper()
             
             # Write player name
-            text = arcade.Text(
-                label,
-                x=x, y=y,
-                color=arcade.color.WHITE,
-                font_size=22.5*self.layout.scale, font_name="Courier New",
-                anchor_x="center", anchor_y="center",
-                align="center", rotation=a
+            self.get_text(
+                f"name_{player.position}", label, x, y,
+                arcade.color.WHITE, 22.5*self.layout.scale, a,
+                batch=self.annotation_batch
             )
-            text.draw()
             
             # Set name annotation label
             if is_dummy:
@@ -1398,57 +1748,43 @@ class Game(arcade.View):
                 label = player.position.upper()
             
             # Write name annotation
-            text = arcade.Text(
-                label,
-                x=x+dodge[0]*30*self.layout.scale,
-                y=y+dodge[1]*30*self.layout.scale,
-                color=[255, 255, 255, 100],
-                font_size=18*self.layout.scale, font_name="Courier New",
-                anchor_x="center", anchor_y="center",
-                align="center", rotation=a
+            self.get_text(
+                f"position_{player.position}", label, label_x, label_y,
+                (255, 255, 255, 100), 18*self.layout.scale, a,
+                batch=self.annotation_batch
             )
-            text.draw()
             
         # Contract: Team
-        x = self.board_contract.right - 55*self.layout.scale
-        y = self.board_contract.bottom + 175*self.layout.scale
-        text = self.annotate_state_text(self.contract_team, 17, x, y, 0, 22*self.layout.scale)  # self.contract_team
-        text.draw()
+        x, y = self.board_positions["contract_team"]
+        self.annotate_state_text("contract_team", self.contract_team, 17, x, y, 0, 22*self.layout.scale)  # self.contract_team
         
         # Contract: Bid
-        x = self.board_contract.right - 55*self.layout.scale
-        y = self.board_contract.bottom + 120*self.layout.scale
-        symbol = self.get_suit_symbol(self.contract_suit)
+        x, y = self.board_positions["contract_bid"]
+        symbol = SUIT_SYMBOLS[self.contract_suit]
         value = f"{self.contract_level} of [{symbol}]"
-        text = self.annotate_state_text(value, 18, x, y, 0, 22*self.layout.scale) # self.contract_level/bid
-        text.draw()
+        self.annotate_state_text("contract_bid", value, 18, x, y, 0, 22*self.layout.scale) # self.contract_level/bid
         
         # Contract: Bid
-        x = self.board_contract.right - 55*self.layout.scale
-        y = self.board_contract.bottom + 65*self.layout.scale
-        text = self.annotate_state_text(self.contract_doubled, 15, x, y, 0, 22*self.layout.scale)
-        text.draw()
+        x, y = self.board_positions["contract_doubled"]
+        self.annotate_state_text("contract_doubled", self.contract_doubled, 15, x, y, 0, 22*self.layout.scale)
         
         # Scoring: Points
-        x = self.board_scoring.right - 55*self.layout.scale
-        y = self.board_scoring.bottom + 175*self.layout.scale
+        x, y = self.board_positions["scoring_points"]
         value = self.score
-        text = self.annotate_state_text(value, 15, x, y, 0, 22*self.layout.scale)
-        text.draw()
+        self.annotate_state_text("scoring_points", value, 15, x, y, 0, 22*self.layout.scale)
         
         # Scoring: Games
-        x = self.board_scoring.right - 55*self.layout.scale
-        y = self.board_scoring.bottom + 120*self.layout.scale
+        x, y = self.board_positions["scoring_games"]
         value = f"{self.current_game}/{self.total_games}"
-        text = self.annotate_state_text(value, 16, x, y, 0, 22*self.layout.scale)
-        text.draw()
+        self.annotate_state_text("scoring_games", value, 16, x, y, 0, 22*self.layout.scale)
         
         # Scoring: Vulnerability
-        x = self.board_scoring.right - 55*self.layout.scale
-        y = self.board_scoring.bottom + 65*self.layout.scale
+        x, y = self.board_positions["scoring_vulnerability"]
         value = self.vulnerability
-        text = self.annotate_state_text(value, 17, x, y, 0, 22*self.layout.scale)
-        text.draw()
+        self.annotate_state_text("scoring_vulnerability", value, 17, x, y, 0, 22*self.layout.scale)
+        
+        # Draw names and board labels in one batch
+        self.annotation_batch.draw()
         
         
         
@@ -1457,61 +1793,74 @@ class Game(arcade.View):
         # Bidding text
         for player in self.player_list:
             
-            # Init 3 diffently colored texts that are stacked to one single text later
-            label_white = ""
-            label_red = ""
-            label_beige = ""
-            
-            # Create text for each player
-            for bid in self.bidding_history:
-                if bid.player == player.position:
-                    symbol = self.convert_bid_to_symbol(bid)
-                    
-                    # Add delimiter
-                    if label_white + label_red + label_beige != "":
-                        label_white += "·"
-                        label_red += " "
-                        label_beige += " "
-            
-                    # Add symbol
-                    if bid.suit in ["clubs", "spades"] or bid.type == "pass":
-                        label_white += symbol
-                        label_red += " " * len(symbol)
-                        label_beige += " " * len(symbol)
-                    elif bid.suit in ["diamonds", "hearts"] or bid.type == "double":
-                        label_white += " " * len(symbol)
-                        label_red += symbol
-                        label_beige += " " * len(symbol)
-                    else:
-                        label_white += " " * len(symbol)
-                        label_red += " " * len(symbol)
-                        label_beige += symbol
+            # Colored pieces of text that make up the bidding of a player
+            runs = self.bidding_runs[player.position]
                     
             # Get relative board position
             rel_position = self.get_display_position(self.player_position, player.position)
             # Set bidding location
-            if rel_position == "bottom":
-                x = self.bidding_strip_bottom.center_x
-                y = self.bidding_strip_bottom.center_y
-            elif rel_position == "top":
-                x = self.bidding_strip_top.center_x
-                y = self.bidding_strip_top.center_y
-            elif rel_position == "left":
-                x = self.bidding_strip_left.center_x
-                y = self.bidding_strip_left.center_y
-            elif rel_position == "right":
-                x = self.bidding_strip_right.center_x
-                y = self.bidding_strip_right.center_y
+            x, y = self.bidding_strips[rel_position].position
             # Draw bidding text
-            text_white = self.annotate_text(label_white, x, y, 0, 30, [255, 255, 255])
-            text_red = self.annotate_text(label_red, x, y, 0, 30, [173, 54, 50])
-            text_beige = self.annotate_text(label_beige, x, y, 0, 30, [255, 204, 170])
-            text_white.draw()
-            text_red.draw()
-            text_beige.draw()
+            text = self.get_bidding_layout(player.position, runs, x, y, 30*self.layout.scale)
+            text.draw()
 
 
             
+    def group_bids(self):
+        """Split bidding history into colored text pieces per player in a single pass"""
+        
+        # Init pieces per player
+        runs_by_player = {position: [] for position in PLAYER_POSITIONS}
+        
+        # Sort every bid into the pieces of its player
+        for bid in self.bidding_history:
+            runs = runs_by_player[bid.player]
+            
+            # Add delimiter
+            if runs:
+                runs.append(("·", BIDDING_WHITE))
+    
+            # Add symbol
+            if bid.suit in ["clubs", "spades"] or bid.type == "pass":
+                runs.append((bid.symbol, BIDDING_WHITE))
+            elif bid.suit in ["diamonds", "hearts"] or bid.type == "double":
+                runs.append((bid.symbol, BIDDING_RED))
+            else:
+                runs.append((bid.symbol, BIDDING_BEIGE))
+                
+        # Freeze pieces (compared against the cached text layouts)
+        self.bidding_runs = {position: tuple(runs) for position, runs in runs_by_player.items()}
+        
+        
+        
+    def get_bidding_layout(self, key, runs, x, y, size):
+        """Reuse the multicolored bidding text of a player and only rebuild it when bids change"""
+        
+        # Rebuild document if bids or font size changed
+        cached = self.bidding_layouts.get(key)
+        if cached is None or cached[0] != (runs, size):
+            label = "".join(text for text, _ in runs)
+            document = pyglet.text.document.FormattedDocument(label)
+            document.set_style(0, len(label), {"font_name": "Courier New", "font_size": size})
+            start = 0
+            for text, color in runs:
+                document.set_style(start, start + len(text), {"color": color})
+                start += len(text)
+            layout = pyglet.text.layout.TextLayout(document, x=x, y=y, anchor_x="center", anchor_y="center")
+            self.bidding_layouts[key] = ((runs, size), layout)
+            return(layout)
+        
+        # Move text if board was resized
+        layout = cached[1]
+        if (layout.x, layout.y) != (x, y):
+            layout.x = x
+            layout.y = y
+        
+        # Return
+        return(layout)
+    
+    
+    
     def convert_bid_to_symbol(self, bid):
         
         # Transform bid to string
@@ -1522,7 +1871,7 @@ class Game(arcade.View):
         elif bid.type == "double":
             symbol = "X"
         else:
-            suit_symbol = self.get_suit_symbol(bid.suit)
+            suit_symbol = SUIT_SYMBOLS[bid.suit]
             symbol = f"{bid.level}{suit_symbol}"
         
         # Return
@@ -1530,39 +1879,20 @@ class Game(arcade.View):
     
     
     
-    def annotate_state_text(self, value, width, x, y, angle, size):
+    def annotate_state_text(self, key, value, width, x, y, angle, size):
         
-        # Set to "" if None
-        value = "TBD" if value is None else value
-        
-        # Transfrom to int (if a number)
-        try:
-            value = int(value)
-        except (ValueError, TypeError):
-            pass
-        
-        # Transform to string
-        value = str(value)
-        
-        # Add dots
-        label = '.' * (width - len(value) - 1) + " " + value
+        # Formatted label (only changes on game events)
+        label = format_state_value(value, width)
         
         # Text object
-        text = arcade.Text(
-            label.upper(),
-            x=x, y=y,
-            color=arcade.color.WHITE,
-            font_size=size, font_name="Courier New",
-            anchor_x="right", anchor_y="center",
-            align="right", rotation=angle
-        )
+        text = self.get_text(key, label, x, y, arcade.color.WHITE, size, angle, "right", self.annotation_batch)
         
         # Return
         return(text)
     
     
       
-    def annotate_text(self, label, x, y, angle, size, color=arcade.color.WHITE):
+    def annotate_text(self, key, label, x, y, angle, size, color=arcade.color.WHITE):
         
         # Set to "" if None
         label = "" if label is None else label
@@ -1577,14 +1907,47 @@ class Game(arcade.View):
         label = str(label)
         
         # Text object
-        text = arcade.Text(
-            label.upper(),
-            x=x, y=y,
-            color=color,
-            font_size=size*self.layout.scale, font_name="Courier New",
-            anchor_x="center", anchor_y="center",
-            align="center", rotation=angle
-        )
+        text = self.get_text(key, label.upper(), x, y, color, size*self.layout.scale, angle)
+        
+        # Return
+        return(text)
+    
+    
+    
+    def get_text(self, key, label, x, y, color, size, angle, anchor_x="center", batch=None):
+        """Reuse the text object of an annotation and only update what changed"""
+        
+        # Properties of the text
+        state = (label, x, y, tuple(color), size, angle)
+        
+        # Create text object on first use
+        if key not in self.text_cache:
+            text = arcade.Text(
+                label,
+                x=x, y=y,
+                color=color,
+                font_size=size, font_name="Courier New",
+                anchor_x=anchor_x, anchor_y="center",
+                align=anchor_x, rotation=angle,
+                batch=batch
+            )
+            self.text_cache[key] = (state, text)
+            return(text)
+        
+        # Update changed properties only (re-layouting text is expensive)
+        cached_state, text = self.text_cache[key]
+        if state != cached_state:
+            if label != cached_state[0]:
+                text.text = label
+            if (x, y) != cached_state[1:3]:
+                text.position = x, y
+            if state[3] != cached_state[3]:
+                text.color = color
+            if size != cached_state[4]:
+                text.font_size = size
+            if angle != cached_state[5]:
+                text.rotation = angle
+            self.text_cache[key] = (state, text)
         
         # Return
         return(text)
@@ -1609,43 +1972,19 @@ class Game(arcade.View):
     def get_display_position(self, bottom_position, position):
         """Finds board position for display purposes"""
     
-        player_positions = ["north", "east", "south", "west"]
-        display_positions = ["bottom", "left", "top", "right"]
-    
-        bottom_index = player_positions.index(bottom_position)
-        position_index = player_positions.index(position)
-        distance = (position_index - bottom_index) % 4
-    
-        return display_positions[distance]
+        return DISPLAY_POSITIONS[(bottom_position, position)]
     
     
     
     def get_suit_symbol(self, suit):
         
-        # Dictionary
-        dictionary = {
-            "clubs": "♣",
-            "diamonds": "♦", 
-            "hearts": "♥",
-            "spades": "♠",
-            "notrump": "NT",
-            None: ""
-        }
-        
-        symbol = dictionary[suit]
-        return(symbol)
+        return(SUIT_SYMBOLS[suit])
     
     
     def sort_cards(self):
         """ Sort card list in the original order """
 
-        self.card_list.sort(key=self.card_sort_key)
-        
-    def card_sort_key(self, card):
-        
-        suit_index = CARD_SUITS.index(card.suit)
-        value_index = CARD_VALUES.index(card.value)
-        return (suit_index, value_index)
+        self.card_list.sort(key=operator.attrgetter("sort_key"))
         
 
 
@@ -1659,6 +1998,9 @@ class MenuView(arcade.View):
         self.toggle_list = []
         self.input_list = []
         
+        # Clipboard texts read in the background, waiting to be inserted
+        self.paste_queue = queue.Queue()
+        
         # Load assets
         self.load_assets()
         
@@ -1682,10 +2024,10 @@ class MenuView(arcade.View):
         self.background = arcade.load_texture("assets/images/lobby.background.png")
         
         # Load sound effects
-        self.sound_drop = arcade.load_sound("assets/effects/drop.mp3")
+        self.sound_drop = get_sound("assets/effects/drop.mp3")
         
         # Load font
-        arcade.load_font("assets/fonts/CourierNewBold.ttf")
+        get_font("assets/fonts/CourierNewBold.ttf")
         
         # Load button textures
         self.textures = {
@@ -1925,17 +2267,8 @@ class MenuView(arcade.View):
         # Handle Ctrl+V (paste)
         if key == arcade.key.V and modifiers & arcade.key.MOD_CTRL:
             
-            # Get copied text
-            clipboard_text = pyperclip.paste()
-            
-            # Add text in active widget
-            for widget in self.input_list:
-                if widget.active:
-                    cursor_pos = widget.caret.position
-                    current_text = widget.text
-                    new_text = current_text[:cursor_pos] + clipboard_text + current_text[cursor_pos:]
-                    widget.text = new_text
-                    widget.caret.position = cursor_pos + len(clipboard_text)
+            # Get copied text (may spawn xclip/xsel, so keep it off the UI thread)
+            threading.Thread(target=self.read_clipboard, daemon=True).start()
                     
         # Handle Ctrl+A (select all)
         elif key == arcade.key.A and modifiers & arcade.key.MOD_CTRL:
@@ -1946,6 +2279,29 @@ class MenuView(arcade.View):
                     widget.caret.mark = 0
                     widget.caret.position = len(widget.text)
                     
+    def read_clipboard(self):
+        """Read clipboard in the background and hand the text to on_update"""
+        
+        try:
+            self.paste_queue.put(pyperclip.paste())
+        except pyperclip.PyperclipException as e:
+            print(f"Clipboard not available: {e}")
+            
+    def on_update(self, delta_time):
+        """Insert pasted texts"""
+        
+        while not self.paste_queue.empty():
+            clipboard_text = self.paste_queue.get()
+            
+            # Add text in active widget
+            for widget in self.input_list:
+                if widget.active:
+                    cursor_pos = widget.caret.position
+                    current_text = widget.text
+                    new_text = current_text[:cursor_pos] + clipboard_text + current_text[cursor_pos:]
+                    widget.text = new_text
+                    widget.caret.position = cursor_pos + len(clipboard_text)
+
     def save_player_data(self, name, server, position, filename="playerdata.json"):
         data = {
             "name": name,
@@ -1991,7 +2347,59 @@ class WaterfallBar():
         self.play_sound = True
         
         # Sound
-        self.sound_drop = arcade.load_sound(r'assets/effects/drop.mp3')
+        self.sound_drop = get_sound(r'assets/effects/drop.mp3')
+        
+        # Text objects (only font size and position change while hovering)
+        font_size = 16 * self.resize
+        self.score_text = arcade.Text(f"{'+' if self.score > 0 else ''}{self.score}", self.x, self.y,
+            font_size=font_size, color=arcade.color.WHITE, 
+            anchor_x="center", anchor_y="center", bold=True)
+        self.total_text = arcade.Text(f"{self.cumulative + self.score}", self.x, self.y,
+            font_size=font_size, color=arcade.color.WHITE, 
+            anchor_x="center", anchor_y="center", bold=True)
+        self.cumulative_text = arcade.Text(f"{self.cumulative}", self.x, self.y,
+            font_size=font_size, color=arcade.color.WHITE, 
+            anchor_x="center", anchor_y="center", bold=True)
+        
+        # Static geometry (normal and enlarged bar)
+        self.shapes = {hover: self.create_shapes(hover) for hover in (False, True)}
+        
+        # Connecting line to left neighbor
+        self.connector = arcade.shape_list.ShapeElementList()
+        self.connector.append(arcade.shape_list.create_line(
+            self.x, self.y - self.height/2,
+            self.x - self.width * 3/2, self.y - self.height/2,
+            arcade.color.WHITE, 2))
+        
+        
+    def create_shapes(self, hover):
+        """Build bar, outline and zero axis once for the given hover state"""
+        
+        padding = 20 * self.resize
+        shapes = arcade.shape_list.ShapeElementList()
+        
+        # Resize factor when enlarged
+        f = 1.2 if hover else 1
+        
+        # Resize bar
+        width, height = self.width*f, self.height*f
+        
+        # Bar
+        shapes.append(arcade.shape_list.create_rectangle_filled(self.x, self.y, width, abs(height), self.color))
+        
+        # Outline
+        shapes.append(arcade.shape_list.create_rectangle_outline(self.x, self.y, width, abs(height), arcade.color.WHITE, 2))
+        
+        # Zero axis
+        actual_height = abs(height)
+        if hover:
+            actual_height = abs(height) + 4 * padding
+        bar_crosses_zero = (self.y - actual_height/2 <= self.zero_y <= self.y + actual_height/2)
+        if not bar_crosses_zero:
+            shapes.append(arcade.shape_list.create_line(
+                self.x - self.gap/2, self.zero_y, self.x + self.gap/2, self.zero_y, arcade.color.WHITE, 2))
+            
+        return shapes
         
         
     def check_hover(self, mouse_x, mouse_y):
@@ -2023,45 +2431,32 @@ class WaterfallBar():
         f = 1.2 if self.hover else 1
         
         # Resize bar
-        width, height = self.width*f, self.height*f
-
-        # Define recangle
-        bar_rect = arcade.XYWH(x=self.x,y=self.y,width=width,height=abs(height))
+        height = self.height*f
             
-        # Draw bar
-        arcade.draw_rect_filled(bar_rect, self.color)
-        
-        # Draw outline
-        arcade.draw_rect_outline(bar_rect, arcade.color.WHITE, 2)
+        # Draw bar, outline and zero axis
+        self.shapes[self.hover].draw()
         
         # Draw score text
-        score_text = f"{'+' if self.score > 0 else ''}{self.score}"
-        arcade.draw_text(score_text, self.x, self.y,
-            font_size=font_size*f, color=arcade.color.WHITE, 
-            anchor_x="center", anchor_y="center", bold=True)
+        if self.score_text.font_size != font_size*f:
+            self.score_text.font_size = font_size*f
+        self.score_text.draw()
         
         # Draw connecting line
         if self.pos > 0 and self.hover == False and self.left_neighbor_hover == False:
-            arcade.draw_line(self.x, self.y - self.height/2,
-                           self.x - self.width * 3/2, self.y - self.height/2,
-                           arcade.color.WHITE, 2)
-            
-        # Draw zero axis
-        actual_height = abs(height)
-        if self.hover:
-            actual_height = abs(height) + 4 * padding
-        bar_crosses_zero = (self.y - actual_height/2 <= self.zero_y <= self.y + actual_height/2)
-        if not bar_crosses_zero:
-            arcade.draw_line(self.x - self.gap/2, self.zero_y, self.x + self.gap/2, self.zero_y, arcade.color.WHITE, 2)
+            self.connector.draw()
             
         # Draw additional information
         if self.hover:
-            arcade.draw_text(f"{self.cumulative + self.score}", self.x, self.y + height/2 + padding * np.sign(height),
-                font_size=font_size*f, color=arcade.color.WHITE, 
-                anchor_x="center", anchor_y="center", bold=True)
-            arcade.draw_text(f"{self.cumulative}", self.x, self.y - height/2 - padding * np.sign(height),
-                font_size=font_size*f, color=arcade.color.WHITE, 
-                anchor_x="center", anchor_y="center", bold=True)
+            sign = (height > 0) - (height < 0)
+            for text, y in (
+                (self.total_text, self.y + height/2 + padding * sign),
+                (self.cumulative_text, self.y - height/2 - padding * sign)
+            ):
+                if text.font_size != font_size*f:
+                    text.font_size = font_size*f
+                if text.y != y:
+                    text.y = y
+                text.draw()
 
 
     def get_info(self):
@@ -2079,6 +2474,9 @@ class GameOverView(arcade.View):
     def __init__(self):
         super().__init__()
         
+        # Current mouse cursor
+        self.cursor_type = None
+        
         # Load background
         self.background = arcade.load_texture("assets/images/gameover.background.png")
         
@@ -2096,8 +2494,8 @@ class GameOverView(arcade.View):
         self.overview_elements = arcade.SpriteList()
         
         # Load sound effects
-        self.sound_drop = arcade.load_sound("assets/effects/drop.mp3")
-        self.sound_store = arcade.load_sound("assets/effects/store.mp3")
+        self.sound_drop = get_sound("assets/effects/drop.mp3")
+        self.sound_store = get_sound("assets/effects/store.mp3")
         
         # Create chart
         self.create_waterfall_chart(self.window.width, self.window.height)
@@ -2120,10 +2518,63 @@ class GameOverView(arcade.View):
         self.overview_download = BoardElement(image_path, self.scale)
         self.overview_elements.append(self.overview_download)
         
+        # Result
+        self.result = "DEFEAT"
+        
+        # Text objects
+        self.create_texts()
+        
         self.on_resize(self.window.width, self.window.height)
         
+    def create_texts(self):
+        """Create text objects once (on_resize only moves and scales them)"""
+        
+        # Hover info
+        self.bid_played_text = arcade.Text("", x=0, y=0,
+            color=arcade.color.WHITE, font_size=24*self.scale,
+            font_name="Courier New", anchor_x="center", anchor_y="center", bold=True)
+        self.bid_target_text = arcade.Text("", x=0, y=0,
+            color=arcade.color.WHITE, font_size=24*self.scale,
+            font_name="Courier New", anchor_x="center", anchor_y="center", bold=True)
+        
         # Result
-        self.result = "DEFEAT"
+        self.result_text = arcade.Text(
+            self.result,
+            x=0, y=0,
+            color=arcade.color.WHITE,
+            font_size=24*self.scale, font_name="Courier New",
+            anchor_x="center", anchor_y="center",
+            align="center", rotation=0, bold=True
+        )
+        
+        # Info text
+        self.info_text = arcade.Text(
+            "GANYMED-KALLISTO (NS) vs. ISIS-OSIRIS (EW)",
+            x=0, y=0,
+            color=arcade.color.WHITE,
+            font_size=16*self.scale, font_name="Courier New",
+            anchor_x="left", anchor_y="top",
+            align="center", rotation=0, bold=True
+        )
+        
+        # Date
+        self.date_text = arcade.Text(
+            datetime.today().strftime('%Y-%m-%d'),
+            x=0, y=0,
+            color=arcade.color.WHITE,
+            font_size=16*self.scale, font_name="Courier New",
+            anchor_x="left", anchor_y="top",
+            align="center", rotation=0, bold=True
+        )
+        
+        # Axis label
+        self.axis_text = arcade.Text(
+            "CUMULATIVE DOUBLE DUMMY SCORE DELTA",
+            x=0, y=0,
+            color=arcade.color.WHITE,
+            font_size=16*self.scale,
+            anchor_x="center", anchor_y="center", bold=True, rotation=-90
+        )
         
     def create_waterfall_chart(self, window_width, window_height):
         """Establishes a waterfall score chart"""
@@ -2202,59 +2653,28 @@ class GameOverView(arcade.View):
         for bar in self.bar_objects:
             info = bar.get_info()
             if info:
-                text = arcade.Text(info["bid_played"],
-                    x=self.overview_bids.center_x - 100*self.scale, y= self.overview_bids.center_y,
-                    color=arcade.color.WHITE, font_size=24*self.scale,
-                    font_name="Courier New", anchor_x="center", anchor_y="center", bold=True)
-                text.draw()
-                text = arcade.Text(info["bid_target"],
-                    x=self.overview_bids.center_x + 100*self.scale, y= self.overview_bids.center_y,
-                    color=arcade.color.WHITE, font_size=24*self.scale,
-                    font_name="Courier New", anchor_x="center", anchor_y="center", bold=True)
-                text.draw()
+                if self.bid_played_text.text != info["bid_played"]:
+                    self.bid_played_text.text = info["bid_played"]
+                if self.bid_target_text.text != info["bid_target"]:
+                    self.bid_target_text.text = info["bid_target"]
+                self.bid_played_text.draw()
+                self.bid_target_text.draw()
                 break  # nur einmal zeichnen
             
         # Draw overview elements
         self.overview_elements.draw()
         
         # Draw result
-        text = arcade.Text(
-            self.result,
-            x=self.window.width/2, y=self.window.height-75*self.scale,
-            color=arcade.color.WHITE,
-            font_size=24*self.scale, font_name="Courier New",
-            anchor_x="center", anchor_y="center",
-            align="center", rotation=0, bold=True
-        )
-        text.draw()    
+        self.result_text.draw()    
             
         # Draw info text
-        text = arcade.Text(
-            "GANYMED-KALLISTO (NS) vs. ISIS-OSIRIS (EW)",
-            x=50*self.scale, y=self.window.height-50*self.scale,
-            color=arcade.color.WHITE,
-            font_size=16*self.scale, font_name="Courier New",
-            anchor_x="left", anchor_y="top",
-            align="center", rotation=0, bold=True
-        )
-        text.draw()
+        self.info_text.draw()
         
         # Draw date
-        text = arcade.Text(
-            datetime.today().strftime('%Y-%m-%d'),
-            x=50*self.scale, y=self.window.height-80*self.scale,
-            color=arcade.color.WHITE,
-            font_size=16*self.scale, font_name="Courier New",
-            anchor_x="left", anchor_y="top",
-            align="center", rotation=0, bold=True
-        )
-        text.draw()
+        self.date_text.draw()
         
         # Draw axis label
-        text = "CUMULATIVE DOUBLE DUMMY SCORE DELTA"
-        arcade.draw_text(text, 100 * self.scale, self.window.height/2,
-            font_size=16 * self.scale, color=arcade.color.WHITE, 
-            anchor_x="center", anchor_y="center", bold=True, rotation=-90)
+        self.axis_text.draw()
         
         # Write player name
 
@@ -2282,6 +2702,20 @@ class GameOverView(arcade.View):
         self.overview_download.position = self.window.width - 80*self.scale, self.window.height - 75*self.scale
         self.overview_download.scale = self.scale
         
+        # Position texts
+        self.bid_played_text.position = self.overview_bids.center_x - 100*self.scale, self.overview_bids.center_y
+        self.bid_target_text.position = self.overview_bids.center_x + 100*self.scale, self.overview_bids.center_y
+        self.result_text.position = self.window.width/2, self.window.height-75*self.scale
+        self.info_text.position = 50*self.scale, self.window.height-50*self.scale
+        self.date_text.position = 50*self.scale, self.window.height-80*self.scale
+        self.axis_text.position = 100 * self.scale, self.window.height/2
+        
+        # Scale texts
+        for text in (self.bid_played_text, self.bid_target_text, self.result_text):
+            text.font_size = 24*self.scale
+        for text in (self.info_text, self.date_text, self.axis_text):
+            text.font_size = 16*self.scale
+        
         
         
         
@@ -2301,7 +2735,10 @@ class GameOverView(arcade.View):
             cursor_type = self.window.CURSOR_DEFAULT
             btn.scale = self.scale
             
-        self.window.set_mouse_cursor(self.window.get_system_mouse_cursor(cursor_type))
+        # Set cursor (only if changed)
+        if cursor_type != self.cursor_type:
+            self.cursor_type = cursor_type
+            self.window.set_mouse_cursor(get_cursor(self.window, cursor_type))
         
         
     def is_mouse_over_bar(self, bar_x, bar_y, bar_width, bar_height):
@@ -3,9 +3,11 @@ Bridge: Server
 """
 
 import socket
-import threading
-import pickle
+import selectors
+import functools
+import json
 import time
+import logging
 import random
 import logic.scoring
 import logic.dealing
@@ -17,6 +19,7 @@ import logic.dealing
 # Card constants
 CARD_VALUES = ["2", "3", "4", "5", "6", "7", "8", "9", "T", "J", "Q", "K", "A"]
 CARD_SUITS = ["diamonds", "clubs", "hearts", "spades"]
+CARD_VALUE_ORDER = {value: i for i, value in enumerate(CARD_VALUES)}
 
 # Notwenidge Spielerzahl
 FULL_TABLE = 1
@@ -24,15 +27,48 @@ FULL_TABLE = 1
 # Player positions
 PLAYER_POSITIONS = ["north", "east", "south", "west"]
 
+# Seating lookups
+TEAM_BY_POSITION = {"north": "northsouth", "south": "northsouth", "east": "eastwest", "west": "eastwest"}
+NEXT_POSITION = {position: PLAYER_POSITIONS[(i + 1) % 4] for i, position in enumerate(PLAYER_POSITIONS)}
+PARTNER_POSITION = {position: PLAYER_POSITIONS[(i + 2) % 4] for i, position in enumerate(PLAYER_POSITIONS)}
+
 # Biddable suits
 SUITS = ["clubs", "diamonds", "hearts", "spades", "notrump"]
+SUIT_ORDER = {suit: i for i, suit in enumerate(SUITS)}
+
+# Allowed values of every field per client action
+ACTION_FIELDS = {
+    "play_card": {"card_suit": CARD_SUITS, "card_value": CARD_VALUES},
+    "take_trick": {},
+    "leave_game": {},
+    "lock_bid": {"bid_type": ["pass", "double", "normal"]}
+}
+
+# Allowed bid level and suit per bid type (None: field left empty)
+BID_FIELDS = {
+    "normal": {"bid_level": [1, 2, 3, 4, 5, 6, 7], "bid_suit": SUITS},
+    "pass": {"bid_level": [None], "bid_suit": [None]},
+    "double": {"bid_level": [None], "bid_suit": [None]}
+}
 
 # Logic parameters
 IDLE_TIME_PLAY = 0.5
 IDLE_TIME_TRICK = 1.0
 IDLE_TIME_PHASE = 0.5
+IDLE_TIME_SCORE = 1.0
 FPS = 20
 
+# Unsent bytes a client may fall behind before it is dropped
+MAX_SEND_BUFFER = 1 << 20
+
+# Largest message a client may announce before it is dropped
+MAX_MESSAGE_SIZE = 1 << 16
+
+
+
+# Server log (debug messages are skipped unless enabled)
+logger = logging.getLogger("bridge.server")
+
 
 
 # ──[ Classes ]────────────────────────────────────────────────────────────────
@@ -40,11 +76,13 @@ FPS = 20
 class ServerCard:
     """ Simplified card for server logics """
     
+    __slots__ = ("suit", "value", "ordinal", "facing", "location", "owner", "trick")
+    
     def __init__(self, suit, value):
         
         self.suit = suit
         self.value = value
-        self.ordinal = CARD_VALUES.index(value)
+        self.ordinal = CARD_VALUE_ORDER[value]
         self.facing = "up"
         self.location = "deck"  # deck, table, hand, dummy, tricks
         self.owner = None
@@ -54,6 +92,8 @@ class ServerCard:
         
 class Client:
     
+    __slots__ = ("socket", "name", "position", "team", "bid_suit", "bid_level", "bid_type")
+    
     def __init__(self, socket, name, position):
         
         # Identity
@@ -72,19 +112,14 @@ class Client:
     def allocate_team(self, position):
         """Allocate team based on player's position"""
         
-        team_by_player = {
-            "north": "northsouth",
-            "south": "northsouth",
-            "east": "eastwest",
-            "west": "eastwest"
-        }
-        team = team_by_player[position]
-        return(team)
+        return(TEAM_BY_POSITION[position])
     
     
     
 class Bid:
     
+    __slots__ = ("player", "type", "level", "suit", "team")
+    
     def __init__(self, player, bid_type, level=None, suit=None):
         
         self.player = player
@@ -98,14 +133,7 @@ class Bid:
     def allocate_team(self, position):
         """Allocate team based on player's position"""
         
-        team_by_player = {
-            "north": "northsouth",
-            "south": "northsouth",
-            "east": "eastwest",
-            "west": "eastwest"
-        }
-        team = team_by_player[position]
-        return(team)
+        return(TEAM_BY_POSITION[position])
 
 
 
@@ -116,6 +144,7 @@ class GameServer:
         self.broadcast_timer = 0.0
         self.client_list = []
         self.bot_list = []
+        self.human_positions = set()
         self.current_turn = "north"
         self.original_turn = "north"
         self.current_sound = None
@@ -135,9 +164,37 @@ class GameServer:
         # Sprite list with all the cards
         self.card_list = []
         
+        # Pending non-blocking pause (see wait_for)
+        self.wait_key = None
+        self.wait_until = 0.0
+        
+        # Cards by suit and value
+        self.card_by_key = {}
+        
+        # Cards by location (kept in sync with every card move)
+        self.hands = {position: [] for position in PLAYER_POSITIONS}
+        self.table = []
+        self.tricks_made = {"northsouth": 0, "eastwest": 0}
+        
         # Bidding history
         self.bidding_history = []
         
+        # Sockets to wait on (listening socket and all clients)
+        self.selector = selectors.DefaultSelector()
+        
+        # Bytes received per client socket but not yet decoded
+        self.receive_buffers = {}
+        
+        # Bytes queued per client socket but not yet sent
+        self.send_buffers = {}
+        
+        # Broadcast pending for the end of this loop iteration
+        self.needs_broadcast = False
+        
+        # Last broadcast state and clients that received it in full
+        self.sent_state = {}
+        self.synced_sockets = set()
+        
 
 
     def start_server(self):
@@ -160,15 +217,15 @@ class GameServer:
         
         s.bind((host, port))
         s.listen(5)
-        s.settimeout(5.0)
         
-        print(f'Server runs on {host}:{port}')
+        logger.info("Server runs on %s:%s", host, port)
         
         # Create every card
         for card_suit in CARD_SUITS:
             for card_value in CARD_VALUES:
                 card = ServerCard(card_suit, card_value)
                 self.card_list.append(card)
+                self.card_by_key[(card_suit, card_value)] = card
                 
         # Create every player
         for position in PLAYER_POSITIONS:
@@ -176,68 +233,111 @@ class GameServer:
             bot = Client(None, name, position)
             self.bot_list.append(bot)
         
-        # Start update loop in seperate thread
-        threading.Thread(target=self.update_loop, daemon=True).start()
+        # Wait for connections and client actions in the update loop
+        s.setblocking(False)
+        self.selector.register(s, selectors.EVENT_READ, self.accept_client)
 
         try:
-            while True:
-                try:
-                    c, addr = s.accept()
-                    data = c.recv(1024)
-                    player_data = pickle.loads(data)
-                    player_position = player_data.get("player_position")
-                    player_name = player_data.get("player_name")
-                    print(f"Connection accepted from {addr} with username {player_name}")
-                    
-                    print(player_position)
-                    
-                    # Dodge position if already taken
-                    player_position = self.assign_player_position(player_position)
-                    
-                    print(player_position)
-                    
-                    # Decline if table is full
-                    if player_position is None:
-                        continue
-                    
-                    print(player_position)
-                    
-                    # Add to client list
-                    client = Client(c, player_name, player_position)
-                    self.client_list.append(client)
-                    
-                    # Remove from bot list
-                    for bot in self.bot_list:
-                        if bot.position == client.position:
-                            self.bot_list.remove(bot)
-                    
-                    # Set sound to none
-                    self.current_sound = None
-                    
-                    # Send board state
-                    self.broadcast()
-                    
-                    # Starte a new thread for each client
-                    client_thread = threading.Thread(target=self.handle_client, args=(c, player_position, player_name), daemon=True)
-                    client_thread.start()
-                except:
-                    pass
+            self.update_loop()
         except KeyboardInterrupt:
-            print('Server stopping...')
+            logger.info("Server stopping...")
         finally:
+            self.selector.close()
             s.close()
-            print('Server closed')
+            logger.info("Server closed")
+
+
+
+    def accept_client(self, s):
+        """Accept a new connection and wait for its handshake"""
+        
+        c, addr = s.accept()
+        c.setblocking(False)
+        c.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        c.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        logger.info("Connection accepted from %s", addr)
+        
+        # First message is the handshake
+        self.selector.register(c, selectors.EVENT_READ, self.join_client)
+        
+        
+        
+    def join_client(self, c):
+        """Seat a connected player after the handshake"""
+        
+        # Receive handshake
+        messages = self.receive_messages(c)
+        
+        # Drop connection if closed before the handshake
+        if messages is None:
+            self.close_connection(c)
+            return
+        
+        # Wait for the rest of the handshake
+        if not messages:
+            return
+        
+        # Drop connection if the handshake is not player data
+        if not isinstance(messages[0], dict):
+            logger.warning("Dropping connection with invalid handshake: %s", messages[0])
+            self.close_connection(c)
+            return
+        
+        # Read player data
+        player_data = messages[0]
+        player_position = player_data.get("player_position")
+        player_name = player_data.get("player_name")
+        logger.info("Handshake from %s for position %s", player_name, player_position)
+        
+        # Dodge position if already taken
+        player_position = self.assign_player_position(player_position)
+        
+        logger.debug("Assigned position %s", player_position)
+        
+        # Decline if table is full
+        if player_position is None:
+            self.close_connection(c)
+            return
+        
+        # Add to client list
+        client = Client(c, player_name, player_position)
+        self.client_list.append(client)
+        self.human_positions.add(player_position)
+        
+        # Wait for actions of this client (instead of the handshake)
+        self.selector.modify(c, selectors.EVENT_READ, functools.partial(self.handle_client, player_position=player_position))
+        
+        # Remove from bot list
+        for bot in self.bot_list:
+            if bot.position == client.position:
+                self.bot_list.remove(bot)
+        
+        # Set sound to none
+        self.current_sound = None
+        
+        # Process actions sent right after the handshake
+        for action in messages[1:]:
+            self.process_action(action, player_position)
+        
+        # Send board state
+        self.needs_broadcast = True
+
+
+
+    def close_connection(self, c):
+        """Close a connection that was never seated as a player"""
+        
+        self.selector.unregister(c)
+        self.receive_buffers.pop(c, None)
+        c.close()
 
 
 
     def assign_player_position(self, player_position):
         """ Assign available board position """
         
-        # Find taken positions
-        taken = {client.position for client in self.client_list}
-        
         # Find available positions
-        available = [pos for pos in PLAYER_POSITIONS if pos not in taken]
+        available = [pos for pos in PLAYER_POSITIONS if pos not in self.human_positions]
 
         # Assign position
         if player_position in available:
@@ -252,20 +352,35 @@ class GameServer:
     def update_loop(self):
         
         # Init reference time
-        last_time = time.time()
+        last_time = time.monotonic()
         
         while True:
             
+            # Handle network events until the next frame is due
+            timeout = max(0.0, last_time + 1/FPS - time.monotonic())
+            for key, mask in self.selector.select(timeout):
+                callback = key.data
+                try:
+                    if mask & selectors.EVENT_READ:
+                        callback(key.fileobj)
+                    # Send queued data once the socket accepts more (skipped if the client was removed)
+                    if mask & selectors.EVENT_WRITE and key.fileobj in self.send_buffers:
+                        self.flush_client(key.fileobj)
+                except Exception as e:
+                    logger.error("Error handling connection: %s", e)
+            
             # Calcualte delta time
-            now = time.time()
+            now = time.monotonic()
             delta_time = now - last_time
-            last_time = now
-    
-            # Call update function
-            self.on_update(delta_time)
-    
-            # 60 FPS-Update-Loop
-            time.sleep(1/FPS)  
+            
+            # Call update function once per frame
+            if delta_time >= 1/FPS:
+                last_time = now
+                self.on_update(delta_time)
+            
+            # Send all changes of this iteration at once
+            if self.needs_broadcast:
+                self.broadcast()
             
             
             
@@ -278,11 +393,12 @@ class GameServer:
         if self.broadcast_timer > 5.0:
             # Reset timer
             self.broadcast_timer = 0.0
-            # Set sound to silent
+            # Set sound to silent (unless it belongs to a pending change)
             original_sound = self.current_sound
-            self.current_sound = None
-            # Send hearbeat
-            self.broadcast()
+            if not self.needs_broadcast:
+                self.current_sound = None
+            # Send hearbeat (full state to resync all clients)
+            self.broadcast(full=True)
             # Reset sound
             self.current_sound = original_sound
         
@@ -320,6 +436,9 @@ class GameServer:
         
         # End bidding phase
         if bidding_ended:
+            # Pause before playing starts
+            if self.wait_for(("playing", self.current_game), IDLE_TIME_PHASE):
+                return
             # Find original bid of contract suit
             declarer_bid = next(
                 bid for bid in self.bidding_history
@@ -333,12 +452,11 @@ class GameServer:
             )
             # Set dummy and declarer position
             self.declarer_position = declarer.position
-            self.dummy_position = PLAYER_POSITIONS[(PLAYER_POSITIONS.index(declarer.position)+2) % 4]
+            self.dummy_position = PARTNER_POSITION[declarer.position]
             # Set game info
-            time.sleep(IDLE_TIME_PHASE)
             self.game_phase = "playing"
-            self.current_turn = PLAYER_POSITIONS[(PLAYER_POSITIONS.index(declarer.position)+1) % 4]
-            self.broadcast()
+            self.current_turn = NEXT_POSITION[declarer.position]
+            self.needs_broadcast = True
             return
 
         # Check no bid round
@@ -353,29 +471,30 @@ class GameServer:
             return
         
         # Let computer bid if no player in that position
-        is_human_player = any(client.position == self.current_turn for client in self.client_list)
+        is_human_player = self.current_turn in self.human_positions
         if not is_human_player:
+            if self.wait_for(("bid", len(self.bidding_history)), IDLE_TIME_PLAY):
+                return
             self.opponent_bid()
-            self.broadcast()
+            self.needs_broadcast = True
 
         
         
     def playing_logic(self):
         
-        # Count cards on table
-        table = [card for card in self.card_list if card.location == "table"]
-        
         # Save opener of turn
-        if len(table) == 0:
+        if len(self.table) == 0:
             self.original_turn = self.current_turn
         
-        if len(table) < 4:
+        if len(self.table) < 4:
                     
             # Let computer play if no player in that position
-            is_human_player = any(client.position == self.current_turn for client in self.client_list)
+            is_human_player = self.current_turn in self.human_positions
             if not is_human_player:
+                if self.wait_for(("play", sum(self.tricks_made.values()), len(self.table)), IDLE_TIME_PLAY):
+                    return
                 self.opponent_play()
-                self.broadcast()
+                self.needs_broadcast = True
         
         else:
             
@@ -383,27 +502,31 @@ class GameServer:
             self.allocate_trick()
             
             # Let computer take trick if no player in that position
-            is_human_player = any(client.position == self.current_turn for client in self.client_list)
+            is_human_player = self.current_turn in self.human_positions
             if not is_human_player:
+                if self.wait_for(("trick", sum(self.tricks_made.values())), IDLE_TIME_TRICK):
+                    return
                 self.take_trick(self.current_turn)
-                time.sleep(IDLE_TIME_TRICK)
-                self.broadcast()
+                self.needs_broadcast = True
                 
-        # Count cards on trick pile
-        tricks = [card for card in self.card_list if card.location == "tricks"]
-        
-        # Advance game 
-        if len(tricks) == 52:
+        # Advance game after all 13 tricks
+        if sum(self.tricks_made.values()) == 13:
             self.game_phase = "scoring"
 
 
 
     def scoring_logic(self):
         
+        # Keep showing the score before resetting
+        if self.wait_key == ("scoring", self.current_game):
+            if not self.wait_for(self.wait_key, IDLE_TIME_SCORE):
+                self.game_phase = "resetting"
+            return
+        
         # Count tricks of contract team
-        tricks_made = sum(1 for card in self.card_list if card.trick == self.contract_team)/4
+        tricks_made = self.tricks_made[self.contract_team]
         
-        print(tricks_made)
+        logger.debug("Tricks made by %s: %s", self.contract_team, tricks_made)
         
         # Was declearer vulnerable?
         if self.vulnerability in ["both", self.contract_team]:
@@ -427,14 +550,13 @@ class GameServer:
                 )
         
         # Update scoring baord
-        self.score += score.get("total") * (1 if self.contract_team == "northsouth" else -1)
+        self.score += score.total * (1 if self.contract_team == "northsouth" else -1)
         
         # Broadcast state
-        self.broadcast()
-        time.sleep(1.0)
-    
-        # Advance game
-        self.game_phase = "resetting"
+        self.needs_broadcast = True
+        
+        # Advance game after a pause
+        self.wait_for(("scoring", self.current_game), IDLE_TIME_SCORE)
         
         
         
@@ -455,7 +577,7 @@ class GameServer:
             player.bid_level = None
             player.bid_type = None # pass, double, normal
             
-        # Broadcast state
+        # Broadcast state now (clients must see the resetting phase before the next deal)
         self.broadcast()
             
         # Advance game
@@ -469,36 +591,88 @@ class GameServer:
                 
                 
 
-    def handle_client(self, c, player_position, player_name):
-
-        while True:
+    def handle_client(self, c, player_position):
+        """Process an action the client sent (socket is readable)"""
+        
+        # Receive complete messages
+        messages = self.receive_messages(c)
+        
+        # Remove client if connection was closed
+        if messages is None:
+            self.remove_player(player_position)
+            return
+        
+        # Wait for the rest of a split message
+        if not messages:
+            return
+                    
+        # Reset sound
+        self.current_sound = None
+        
+        # Process client actions
+        for action in messages:
+            self.process_action(action, player_position)
+    
+        # Sende updated game state to all clients
+        self.needs_broadcast = True
+        
+        
+        
+    def receive_messages(self, c):
+        """Read a readable socket and return all complete messages (None if closed or misbehaving)"""
+        
+        # Bytes left over from earlier reads (messages may be split or merged by TCP)
+        buffer = self.receive_buffers.setdefault(c, bytearray())
+        
+        # Receive data
+        try:
+            chunk = c.recv(4096)
+        except BlockingIOError:
+            return([])
+        except OSError as e:
+            logger.warning("Error receiving from client: %s", e)
+            chunk = b""
+        if not chunk:
+            return None
+        buffer += chunk
+        
+        # Decode every complete message (4-byte big-endian length prefix)
+        messages = []
+        while len(buffer) >= 4:
+            size = int.from_bytes(buffer[:4], "big")
             
+            # Drop connection instead of buffering an oversized message
+            if size > MAX_MESSAGE_SIZE:
+                logger.warning("Dropping connection announcing a %d byte message", size)
+                return None
+            
+            if len(buffer) < 4 + size:
+                break
+            data = bytes(buffer[4:4 + size])
+            del buffer[:4 + size]
             try:
-                # Receive data
-                data = c.recv(4096)
-                
-                if data:
-                    
-                    # Reset sound
-                    self.current_sound = None
-                    
-                    # Process client action
-                    action = pickle.loads(data)
-                    self.process_action(action, player_position)
-                
-                    # Sende updated game state to all clients
-                    self.broadcast()
-                    
-            except:
-                pass
+                messages.append(json.loads(data))
+            except ValueError as e:
+                logger.warning("Dropping malformed message: %s", e)
+        
+        return(messages)
 
 
 
     def process_action(self, action, player_position):
         
+        # Ignore anything that is not an action
+        if not isinstance(action, dict):
+            return
+        
         # Get action type
         action_type = action.get("type")
         
+        # Ignore unknown actions and actions with missing or invalid fields
+        if not self.valid_action(action):
+            logger.warning("Ignoring invalid action from %s: %s", player_position, action)
+            return
+        
         # Play card action
         if action_type == "play_card":
             self.play_card(action, player_position)
@@ -516,6 +690,28 @@ class GameServer:
 
 
 
+    def valid_action(self, action):
+        """Check type and fields of a client action against ACTION_FIELDS (and BID_FIELDS for bids)"""
+        
+        # Known action type
+        action_type = action.get("type")
+        if not isinstance(action_type, str) or action_type not in ACTION_FIELDS:
+            return(False)
+        
+        # Fields required by the action (bids also by their bid type)
+        fields = dict(ACTION_FIELDS[action_type])
+        bid_type = action.get("bid_type")
+        if action_type == "lock_bid" and isinstance(bid_type, str):
+            fields.update(BID_FIELDS.get(bid_type, {}))
+        
+        # Values must match exactly (type included, so True or 1.0 is no bid level)
+        return(all(
+            any(type(action.get(field)) is type(option) and action.get(field) == option for option in allowed)
+            for field, allowed in fields.items()
+        ))
+
+
+
     def play_card(self, action, player_position):
         """Move cards from table to trick stack"""
         
@@ -527,18 +723,9 @@ class GameServer:
         if player_position != self.current_turn:
             return
         
-        # Get cards on table
-        table = [
-            card for card in self.card_list 
-            if card.location == "table"
-        ]
-        
-        # Get cards in player's hand
-        hand = [
-            card for card in self.card_list 
-            if card.location == "hand"
-            and card.owner == player_position
-        ]
+        # Get cards on table and in player's hand
+        table = self.table
+        hand = self.hands[player_position]
         
         # Check if last trick was taken
         if len(table) == 4:
@@ -569,21 +756,13 @@ class GameServer:
             
         # Move card to table (owner stays to track who played)
         card.location = "table"
-        
-        # Move card on top
-        self.card_list.remove(card)
-        self.card_list.append(card)
+        hand.remove(card)
+        table.append(card)
         
         # Set sound
         self.current_sound = 'play_card'
         
-        print(f"Player {player_position} played {card_value} of {card_suit}")
-        
-        # Get cards on table
-        table = [
-            card for card in self.card_list 
-            if card.location == "table"
-        ]
+        logger.debug("Player %s played %s of %s", player_position, card_value, card_suit)
         
         # Advance turn
         if len(table) < 4:
@@ -603,21 +782,20 @@ class GameServer:
             if not (self.current_turn == self.dummy_position and player_position == self.declarer_position):
                 return
                 
-        # Get cards on table
-        table = [card for card in self.card_list if card.location == "table"]
-        
         # Check if 4 cards on table
-        if len(table) != 4:
+        if len(self.table) != 4:
             return
+        
+        # Team taking the trick
+        team = TEAM_BY_POSITION[self.current_turn]
                 
         # Move cards to trick stack
-        for card in table:
+        for card in self.table:
             card.facing = "down"
             card.location = "tricks"
-            if self.current_turn in ["north", "south"]:
-                card.trick = "northsouth"
-            else:
-                card.trick = "eastwest"
+            card.trick = team
+        self.table.clear()
+        self.tricks_made[team] += 1
                 
         # Set sound
         self.current_sound = 'take_trick'
@@ -671,7 +849,7 @@ class GameServer:
         client.bid_suit = action.get("bid_suit")
         client.bid_type = action.get("bid_type")
         
-        print(f"Player {player_position} bid")
+        logger.debug("Player %s bid", player_position)
         
         # Set contract
         if bid_type == "normal":
@@ -703,7 +881,7 @@ class GameServer:
         if bid_level is None:
             ordinal = -1
         else:
-            ordinal = SUITS.index(bid_suit) + (bid_level-1)*5
+            ordinal = SUIT_ORDER[bid_suit] + (bid_level-1)*5
        
         return(ordinal)
 
@@ -712,19 +890,16 @@ class GameServer:
     def allocate_trick(self):
         
         # Get cards on table
-        table = [card for card in self.card_list if card.location == "table"]
+        table = self.table
         
         # Check if 4 cards on table
         if len(table) != 4:
             return
         
-        # Find highests card on table
-        highcard = table[0]
-        for card in table:
-            if card.suit == highcard.suit and card.ordinal >= highcard.ordinal:
-                highcard = card
-            elif card.suit == self.contract_suit and highcard.suit != self.contract_suit:
-                highcard = card
+        # Find highest card on table (trump beats lead suit, lead suit beats the rest)
+        lead_suit = table[0].suit
+        trump_suit = self.contract_suit
+        highcard = max(table, key=lambda card: (card.suit == trump_suit, card.suit == lead_suit, card.ordinal))
                 
         # Set next lead
         self.current_turn = highcard.owner
@@ -743,6 +918,12 @@ class GameServer:
     def remove_client(self, client_socket, player_position):
         """Removes client from game"""
         
+        # Stop waiting for actions
+        try:
+            self.selector.unregister(client_socket)
+        except (KeyError, ValueError):
+            pass
+        
         try:
             client_socket.shutdown(socket.SHUT_RDWR)
         except Exception:
@@ -750,53 +931,59 @@ class GameServer:
         finally:
             client_socket.close()
         
+        # Next client on this socket needs the full state
+        self.synced_sockets.discard(client_socket)
+        self.receive_buffers.pop(client_socket, None)
+        self.send_buffers.pop(client_socket, None)
+        
         
         client = next((client for client in self.client_list if client.position == player_position), None)
         self.client_list.remove(client)
-        print(f"Client {player_position} was removed from the game")
+        self.human_positions.discard(player_position)
+        logger.info("Client %s was removed from the game", player_position)
 
 
 
     def find_card(self, suit, value):
         """Find a card in the deck by suit and value"""
         
-        for card in self.card_list:
-            if card.suit == suit and card.value == value:
-                return card
-        return None
+        return self.card_by_key.get((suit, value))
     
 
 
+    def wait_for(self, key, delay):
+        """Non-blocking pause: True until delay seconds passed since the first call with this key"""
+        
+        # Start a new pause
+        now = time.monotonic()
+        if key != self.wait_key:
+            self.wait_key = key
+            self.wait_until = now + delay
+        
+        # Still waiting
+        return(now < self.wait_until)
+        
+        
+
     def advance_turn(self):
         """Move to next player in turn order"""
     
         # Set current_turn to next player
-        index_0 = PLAYER_POSITIONS.index(self.current_turn)
-        index_1 = (index_0 + 1) % 4
-        self.current_turn = PLAYER_POSITIONS[index_1]
+        self.current_turn = NEXT_POSITION[self.current_turn]
 
         
 
     def opponent_play(self):
         """Play card for non-player opponent"""
         
-        time.sleep(IDLE_TIME_PLAY)
-        
         # Init selected card
         selected_card = None
         
         # Get cards on table
-        table = [
-            card for card in self.card_list 
-            if card.location == "table"
-        ]
+        table = self.table
             
         # Select opponent's card
-        hand = [
-            card for card in self.card_list 
-            if card.location == "hand"
-            and card.owner == self.current_turn
-        ]
+        hand = self.hands[self.current_turn]
         
         # Select card by following suit
         if len(table) > 0:
@@ -811,20 +998,12 @@ class GameServer:
         
         # Move card from hand to table
         selected_card.location = "table"
-        
-        # Move card on top
-        self.card_list.remove(selected_card)
-        self.card_list.append(selected_card)
+        hand.remove(selected_card)
+        table.append(selected_card)
         
         # Set sound
         self.current_sound = 'play_card'
         
-        # Get cards on table
-        table = [
-            card for card in self.card_list 
-            if card.location == "table"
-        ]
-        
         # Advance turn
         if len(table) < 4:
             self.advance_turn()
@@ -835,8 +1014,6 @@ class GameServer:
         
     def opponent_bid(self):
         
-        time.sleep(IDLE_TIME_PLAY)
-        
         # Select client
         bot = next(bot for bot in self.bot_list 
                       if bot.position == self.current_turn)
@@ -851,7 +1028,7 @@ class GameServer:
                 bot.bid_level = 1
                 bot.bid_type = "normal"
             elif self.contract_level < 4:
-                index = (SUITS.index(self.contract_suit) + 1) % 5
+                index = (SUIT_ORDER[self.contract_suit] + 1) % 5
                 bot.bid_level = self.contract_level + (index==0)
                 bot.bid_suit = SUITS[index]
                 bot.bid_type = "normal"
@@ -895,11 +1072,18 @@ class GameServer:
         # Parse deal
         deal_dict = self.pbn_to_deal_dict(deal)
         
+        # Clear card indexes of the last game
+        for hand in self.hands.values():
+            hand.clear()
+        self.table.clear()
+        self.tricks_made = {"northsouth": 0, "eastwest": 0}
+        
         # Allocate cards according to deal
         for i, card in enumerate(self.card_list):
             card.facing = "up"
             card.location = "hand"
             card.owner = deal_dict[(card.suit, card.value)]
+            self.hands[card.owner].append(card)
             
         # Increate current game by 1
         self.current_game += 1
@@ -908,7 +1092,7 @@ class GameServer:
         self.game_phase = "bidding"
             
         # Send board state to clients
-        self.broadcast()
+        self.needs_broadcast = True
         
         
         
@@ -934,81 +1118,128 @@ class GameServer:
             
      
     
-    def broadcast(self):
-        """Send game state to all connected clients"""
+    def broadcast(self, full=False):
+        """Send changed game state to all connected clients"""
+        
+        # Pending changes are included in this broadcast
+        self.needs_broadcast = False
+        
+        # Create the game state (identical for every client)
+        game_state = {
+            "cards": [],
+            "players": [],
+            "bidding_history": [],
+            "game_phase": self.game_phase,
+            "current_turn": self.current_turn,
+            "original_turn": self.original_turn,
+            "sound": self.current_sound,
+            "contract_suit": self.contract_suit,
+            "contract_level": self.contract_level,
+            "contract_doubled": self.contract_doubled,
+            "contract_team": self.contract_team,
+            "score": self.score,
+            "current_game": self.current_game,
+            "total_games": self.total_games,
+            "vulnerability": self.vulnerability,
+            "dummy_position": self.dummy_position,
+            "declarer_position": self.declarer_position
+        }
         
-        for client in self.client_list:
+        # Add card information (suit, value, facing, location, owner, trick)
+        game_state["cards"] = [
+            (card.suit, card.value, card.facing, card.location, card.owner, card.trick)
+            for card in self.card_list
+        ]
             
-            # Create a personalized game state for this player
-            game_state = {
-                "cards": [],
-                "players": [],
-                "bidding_history": [],
-                "game_phase": self.game_phase,
-                "current_turn": self.current_turn,
-                "original_turn": self.original_turn,
-                "sound": self.current_sound,
-                "contract_suit": self.contract_suit,
-                "contract_level": self.contract_level,
-                "contract_doubled": self.contract_doubled,
-                "contract_team": self.contract_team,
-                "score": self.score,
-                "current_game": self.current_game,
-                "total_games": self.total_games,
-                "vulnerability": self.vulnerability,
-                "dummy_position": self.dummy_position,
-                "declarer_position": self.declarer_position
+        # Add bidding history
+        for bid in self.bidding_history:
+            bid_info = {
+                "player": bid.player,
+                "type": bid.type,
+                "level": bid.level,
+                "suit": bid.suit,
+                "team": bid.team
             }
+            game_state["bidding_history"].append(bid_info)
             
-            # Add card information with appropriate visibility
-            for card in self.card_list:
-                card_info = {
-                    "suit": card.suit,
-                    "value": card.value,
-                    "facing": card.facing,
-                    "location": card.location,
-                    "owner": card.owner,
-                    "trick": card.trick
-                }
-                game_state["cards"].append(card_info)
-                
-            # Add bidding history
-            for bid in self.bidding_history:
-                bid_info = {
-                    "player": bid.player,
-                    "type": bid.type,
-                    "level": bid.level,
-                    "suit": bid.suit,
-                    "team": bid.team
-                }
-                game_state["bidding_history"].append(bid_info)
-                
-            # Add player info
-            for player in self.client_list + self.bot_list:
-                player_info = {
-                    "name": player.name,
-                    "position": player.position,
-                    "team": player.team,
-                    "bid_suit": player.bid_suit,
-                    "bid_level": player.bid_level,
-                    "bid_type": player.bid_type
-                }
-                game_state["players"].append(player_info)
-            
-            # Send game state to client
-            try:
-                size = pickle.dumps(game_state)
-                print(f"Sending game state ({len(size)} bytes)")
-                client.socket.sendall(pickle.dumps(game_state))
-            except Exception:
-                print(f"Error sending to {client.position}")
+        # Add player info
+        for player in self.client_list + self.bot_list:
+            player_info = {
+                "name": player.name,
+                "position": player.position,
+                "team": player.team,
+                "bid_suit": player.bid_suit,
+                "bid_level": player.bid_level,
+                "bid_type": player.bid_type
+            }
+            game_state["players"].append(player_info)
+        
+        # Fields changed since the last broadcast (sound is an event and always sent)
+        delta = {
+            key: value for key, value in game_state.items()
+            if key == "sound" or key not in self.sent_state or self.sent_state[key] != value
+        }
+        self.sent_state = game_state
+        
+        # Serialize the delta, and the full state only for a heartbeat or clients not yet synced
+        messages = {False: self.encode_message(delta)}
+        if full or any(client.socket not in self.synced_sockets for client in self.client_list):
+            messages[True] = self.encode_message(game_state)
+        
+        # Queue game state for every client (copy, failed clients are removed)
+        for client in list(self.client_list):
+            buffer = self.send_buffers.setdefault(client.socket, bytearray())
+            buffer += messages[full or client.socket not in self.synced_sockets]
+            self.synced_sockets.add(client.socket)
+            
+            # Drop clients that stopped reading instead of blocking the game
+            if len(buffer) > MAX_SEND_BUFFER:
+                logger.warning("Client %s fell behind, dropping it", client.position)
                 self.remove_player(client.position)
+                continue
+            
+            self.flush_client(client.socket)
+
+
+
+    def encode_message(self, state):
+        """Serialize a state for sending (4-byte big-endian length prefix)"""
+        
+        payload = json.dumps(state, separators=(",", ":")).encode("utf-8")
+        
+        return(len(payload).to_bytes(4, "big") + payload)
+
+
+
+    def flush_client(self, c):
+        """Send as much queued data as the socket accepts without blocking"""
+        
+        buffer = self.send_buffers[c]
+        
+        # Send queued bytes
+        try:
+            sent = c.send(buffer)
+        except BlockingIOError:
+            sent = 0
+        except OSError as e:
+            client = next(client for client in self.client_list if client.socket is c)
+            logger.warning("Error sending to %s: %s", client.position, e)
+            self.remove_player(client.position)
+            return
+        del buffer[:sent]
+        
+        # Wait for the socket to become writable while data is left
+        key = self.selector.get_key(c)
+        events = selectors.EVENT_READ | selectors.EVENT_WRITE if buffer else selectors.EVENT_READ
+        if key.events != events:
+            self.selector.modify(c, events, key.data)
 
 
 
 # ──[ Main ]───────────────────────────────────────────────────────────────────
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     server = GameServer()
     server.start_server()
 
@@ -1,3 +1,11 @@
+import random
+
+
+# Card order in PBN hands (suits as listed, ranks from high to low)
+PBN_SUITS = "SHDC"
+PBN_RANKS = "AKQJT98765432"
+
+
 def generate_deal(seed):
     
     """
@@ -10,6 +18,20 @@ def generate_deal(seed):
         str: deal in the Portable Bridge Notation (PBN) format
     """
     
-    pbn_string = "N:AQ.A9765.AQJT.J7 87432.J843.62.Q6 K.KQT2.K875.AT94 JT965..943.K8532"
+    # Shuffle the deck (same seed, same deal)
+    deck = [(suit, rank) for suit in range(4) for rank in range(13)]
+    random.Random(seed).shuffle(deck)
     
-    return pbn_string
\ No newline at end of file
+    # Deal 13 cards to every hand, starting with north
+    hands = []
+    for i in range(4):
+        hand = sorted(deck[i*13:(i+1)*13])
+        suits = [
+            "".join(PBN_RANKS[rank] for card_suit, rank in hand if card_suit == suit)
+            for suit in range(4)
+        ]
+        hands.append(".".join(suits))
+    
+    pbn_string = "N:" + " ".join(hands)
+    
+    return pbn_string
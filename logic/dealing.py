@@ -29,6 +29,13 @@ VUL_MAP = {
     "both":       (Vul.both, "All"),
 }
 
+# Chicago rotation: (dealer, vulnerability) of the 16 boards in one cycle
+ROTATION = tuple(
+    (POSITIONS[position], VULS[(block + position) % 4])
+    for block in range(4)
+    for position in range(4)
+)
+
 
 # ---------------------------------------------------------------------------
 # Data model
@@ -52,14 +59,17 @@ class Board:
 # Board / session creation
 # ---------------------------------------------------------------------------
 
+def chicago_rotate(round_number):
+    """Return (dealer, vulnerability) of a round (starting from 0)."""
+
+    return ROTATION[round_number % 16]
+
+
 def create_board(board_number):
     """Generate and return a Board for the given board number."""
 
-    i = board_number - 1
-
-    deal   = str(generate_deal())
-    dealer = POSITIONS[i % 4]
-    vul    = VULS[(i // 4 + i % 4) % 4]
+    deal        = str(generate_deal())
+    dealer, vul = chicago_rotate(board_number - 1)
 
     # Par calculation
     par_result    = par(Deal(deal), VUL_MAP[vul][0], POSITION_MAP[dealer][0])
@@ -1,3 +1,80 @@
+import functools
+from typing import NamedTuple
+
+import numpy as np
+
+
+# Codes of suits and doubling status
+SUIT_CODES = {'clubs': 0, 'diamonds': 1, 'hearts': 2, 'spades': 3, 'notrump': 4}
+DOUBLED_CODES = {'': 0, 'X': 1, 'XX': 2}
+
+# Scoring tables indexed by suit code, doubled code, contract level and vulnerability (0/1)
+SUIT_BASE = (20, 20, 30, 30, 30)
+SUIT_FIRST_TRICK = (0, 0, 0, 0, 10)
+DOUBLED_MULTIPLIER = (1, 2, 4)
+DOUBLED_OVERTRICK = ((0, 0), (100, 200), (200, 400))
+INSULT_BONUS = (0, 50, 100)
+GAME_BONUS = (300, 500)
+SLAM_BONUS = ((0, 0),) * 6 + ((500, 750), (1000, 1500))
+PART_SCORE_BONUS = 50
+
+# Penalty of the first and of every further undertrick (by doubled code and vulnerability)
+PENALTY_FIRST = ((50, 100), (100, 200), (200, 400))
+PENALTY_NEXT = ((50, 100), (200, 300), (400, 600))
+
+# Integer types of the batch path (inputs fit in int8, all scores stay within int16)
+INPUT_DTYPE = np.int8
+SCORE_DTYPE = np.int16
+
+
+class ChicagoScore(NamedTuple):
+    """Score components of a Chicago Bridge game."""
+
+    contract_points: int
+    overtricks: int
+    bonuses: int
+    insult_bonus: int
+    slam_bonus: int
+    game_bonus: int
+    part_score_bonus: int
+    penalty: int
+    total: int
+
+    def as_dict(self):
+        """Return the components as a plain dict (for legacy callers)."""
+
+        return dict(self._asdict())
+
+
+# Score components (in order of the result)
+SCORE_FIELDS = ChicagoScore._fields
+
+
+class DealBatch(NamedTuple):
+    """Inputs of many Chicago Bridge games, one int8 (or bool) array per field."""
+
+    levels: np.ndarray
+    suits: np.ndarray
+    doubled: np.ndarray
+    vulnerable: np.ndarray
+    tricks: np.ndarray
+
+    @classmethod
+    def from_games(cls, games):
+        """Build a batch from (level, suit, doubled, vulnerable, tricks) tuples with string suits."""
+
+        # Columns of the games
+        levels, suits, doubled, vulnerable, tricks = zip(*games) if games else ((),) * 5
+
+        return cls(
+            np.array(levels, dtype=np.int8),
+            np.array([SUIT_CODES[suit] for suit in suits], dtype=np.int8),
+            np.array([DOUBLED_CODES[dbl] for dbl in doubled], dtype=np.int8),
+            np.array(vulnerable, dtype=bool),
+            np.array(tricks, dtype=np.int8),
+        )
+
+
 def chicago_score(contract_level, contract_suit, doubled, declarer_vulnerable, tricks_made):
     
     """
@@ -11,89 +88,151 @@ def chicago_score(contract_level, contract_suit, doubled, declarer_vulnerable, t
         tricks_made (int): Number of tricks made
         
     Returns:
-        dict: Breakdown of the score components
+        ChicagoScore: Breakdown of the score components
     """
     
-    # Base values for suits and multipliers
-    suit_points = {'clubs': 20, 'diamonds': 20, 'hearts': 30, 'spades': 30, 'notrump': 30}
-    doubling_multiplier = {'': 1, 'X': 2, 'XX': 4}
+    # Score components from the numeric core
+    return chicago_score_core(
+        contract_level, SUIT_CODES[contract_suit], DOUBLED_CODES[doubled],
+        declarer_vulnerable, tricks_made
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def chicago_score_core(contract_level, suit_code, doubled_code, declarer_vulnerable, tricks_made):
+    
+    """
+    Calculates the score components of a Chicago Bridge game from integer codes.
+    
+    Results are cached: the whole input domain has only 2940 combinations.
+    
+    Args:
+        contract_level (int): Level of the contract (1-7)
+        suit_code (int): Suit of the contract (see SUIT_CODES)
+        doubled_code (int): Doubling status (see DOUBLED_CODES)
+        declarer_vulnerable (bool): Whether the declarer is vulnerable
+        tricks_made (int): Number of tricks made
+        
+    Returns:
+        ChicagoScore: Breakdown of the score components
+    """
     
     # Basic calculation variables
-    base_score = suit_points[contract_suit]
-    multiplier = doubling_multiplier[doubled]
+    vulnerable = 1 if declarer_vulnerable else 0
+    base_score = SUIT_BASE[suit_code]
+    multiplier = DOUBLED_MULTIPLIER[doubled_code]
     required_tricks = 6 + contract_level
     overtricks = tricks_made - required_tricks
     
-    # Initialize result dictionary
-    result = {
-        'contract_points': 0,
-        'overtricks': 0,
-        'bonuses': 0,
-        'insult_bonus': 0,
-        'slam_bonus': 0,
-        'game_bonus': 0,
-        'part_score_bonus': 0,
-        'penalty': 0,
-        'total': 0
-    }
+    # Score components
+    contract_points = 0
+    overtrick_points = 0
+    insult_bonus = 0
+    slam_bonus = 0
+    game_bonus = 0
+    part_score_bonus = 0
+    penalty = 0
     
     # Contract made or exceeded
     if overtricks >= 0:
-        # Base points for the contract
-        first_trick_bonus = 10 if contract_suit == 'notrump' else 0
-        result['contract_points'] = contract_level * base_score * multiplier + first_trick_bonus * multiplier
+        # Base points for the contract (notrump: extra points for the first trick)
+        contract_points = (contract_level * base_score + SUIT_FIRST_TRICK[suit_code]) * multiplier
         
-        # Overtricks
-        if doubled == '':
-            result['overtricks'] = overtricks * base_score
-        elif doubled == 'X':
-            result['overtricks'] = overtricks * (200 if declarer_vulnerable else 100)
-        else:  # redoubled
-            result['overtricks'] = overtricks * (400 if declarer_vulnerable else 200)
+        # Overtricks (trick value undoubled, fixed rate doubled/redoubled)
+        if doubled_code == 0:
+            overtrick_points = overtricks * base_score
+        else:
+            overtrick_points = overtricks * DOUBLED_OVERTRICK[doubled_code][vulnerable]
         
         # Game/Part-score Bonus
-        if result['contract_points'] < 100:
-            result['part_score_bonus'] = 50
+        if contract_points < 100:
+            part_score_bonus = PART_SCORE_BONUS
         else:
-            result['game_bonus'] = 500 if declarer_vulnerable else 300
+            game_bonus = GAME_BONUS[vulnerable]
         
         # Slam bonus
-        if contract_level == 6:
-            result['slam_bonus'] = 750 if declarer_vulnerable else 500
-        elif contract_level == 7:
-            result['slam_bonus'] = 1500 if declarer_vulnerable else 1000
+        slam_bonus = SLAM_BONUS[contract_level][vulnerable]
         
         # Insult bonus (for making doubled/redoubled contracts)
-        if doubled == 'X':
-            result['insult_bonus'] = 50
-        elif doubled == 'XX':
-            result['insult_bonus'] = 100
+        insult_bonus = INSULT_BONUS[doubled_code]
     
     # Contract down
     else:
-        # Calculate penalties for contracts that went down
-        down = abs(overtricks)
+        # Calculate penalties for contracts that went down (first undertrick, then every further one)
+        down = -overtricks
+        penalty = -(PENALTY_FIRST[doubled_code][vulnerable] + (down - 1) * PENALTY_NEXT[doubled_code][vulnerable])
+    
+    # Calculate total bonus points
+    bonuses = part_score_bonus + game_bonus + slam_bonus + insult_bonus
+    
+    # Calculate total score
+    total = contract_points + overtrick_points + bonuses + penalty
+    
+    return ChicagoScore(
+        contract_points, overtrick_points, bonuses, insult_bonus, slam_bonus,
+        game_bonus, part_score_bonus, penalty, total
+    )
+
+
+def chicago_score_batch(contract_level, suit_code, doubled_code, declarer_vulnerable, tricks_made):
+    
+    """
+    Calculates the score breakdown of many Chicago Bridge games at once.
+    
+    Args:
+        contract_level (array of int): Level of the contracts (1-7)
+        suit_code (array of int): Suit of the contracts (see SUIT_CODES)
+        doubled_code (array of int): Doubling status (see DOUBLED_CODES)
+        declarer_vulnerable (array of bool): Whether the declarers are vulnerable
+        tricks_made (array of int): Number of tricks made
         
-        if doubled == '':
-            # Not doubled: 50 (not vulnerable) or 100 (vulnerable) per undertrick
-            result['penalty'] = -down * (100 if declarer_vulnerable else 50)
-        else:
-            # Doubled or redoubled
-            penalty = 0
-            
-            if declarer_vulnerable:
-                # Vulnerable: 200, 300, 300, ...
-                penalty = 200 + (down - 1) * 300
-            else:
-                # Not vulnerable: 100, 200, 200, ...
-                if down == 1:
-                    penalty = 100
-                else:
-                    penalty = 100 + (down - 1) * 200
-            
-            # Redoubled doubles the penalty again
-            penalty *= 2 if doubled == 'XX' else 1
-            result['penalty'] = -penalty
+    Returns:
+        numpy structured array: Score components per game (see SCORE_FIELDS)
+    """
+    
+    # Inputs as small integer arrays
+    level = np.asarray(contract_level, dtype=INPUT_DTYPE)
+    suit = np.asarray(suit_code, dtype=INPUT_DTYPE)
+    dbl = np.asarray(doubled_code, dtype=INPUT_DTYPE)
+    vul = np.asarray(declarer_vulnerable, dtype=bool)
+    vul_index = vul.astype(INPUT_DTYPE)
+    tricks = np.asarray(tricks_made, dtype=INPUT_DTYPE)
+    
+    # Base values for suits and multipliers (indexed by code)
+    base_score = np.array(SUIT_BASE, dtype=SCORE_DTYPE)[suit]
+    multiplier = np.array(DOUBLED_MULTIPLIER, dtype=SCORE_DTYPE)[dbl]
+    overtricks = tricks - (6 + level)
+    made = overtricks >= 0
+    
+    # Result with one row per game
+    result = np.zeros(np.broadcast(level, suit, dbl, vul, tricks).shape, dtype=[(field, SCORE_DTYPE) for field in SCORE_FIELDS])
+    
+    # Base points for the contract (notrump: 10 extra for the first trick)
+    first_trick_bonus = np.array(SUIT_FIRST_TRICK, dtype=SCORE_DTYPE)[suit]
+    contract_points = (level * base_score + first_trick_bonus) * multiplier
+    result['contract_points'] = np.where(made, contract_points, 0)
+    
+    # Overtricks (undoubled: trick value, doubled/redoubled: 100/200 and twice that vulnerable)
+    doubled_rate = np.array(DOUBLED_OVERTRICK, dtype=SCORE_DTYPE)[dbl, vul_index]
+    overtrick_rate = np.where(dbl == 0, base_score, doubled_rate)
+    result['overtricks'] = np.where(made, overtricks * overtrick_rate, 0)
+    
+    # Game/Part-score Bonus
+    is_game = result['contract_points'] >= 100
+    result['part_score_bonus'] = np.where(made & ~is_game, PART_SCORE_BONUS, 0)
+    result['game_bonus'] = np.where(made & is_game, np.array(GAME_BONUS, dtype=SCORE_DTYPE)[vul_index], 0)
+    
+    # Slam bonus
+    result['slam_bonus'] = np.where(made, np.array(SLAM_BONUS, dtype=SCORE_DTYPE)[level, vul_index], 0)
+    
+    # Insult bonus (for making doubled/redoubled contracts)
+    result['insult_bonus'] = np.where(made, np.array(INSULT_BONUS, dtype=SCORE_DTYPE)[dbl], 0)
+    
+    # Penalties for contracts that went down
+    down = -overtricks
+    first_penalty = np.array(PENALTY_FIRST, dtype=SCORE_DTYPE)[dbl, vul_index]
+    next_penalty = np.array(PENALTY_NEXT, dtype=SCORE_DTYPE)[dbl, vul_index]
+    result['penalty'] = np.where(made, 0, -(first_penalty + (down - 1) * next_penalty))
     
     # Calculate total bonus points
     result['bonuses'] = (
@@ -106,4 +245,48 @@ def chicago_score(contract_level, contract_suit, doubled, declarer_vulnerable, t
     # Calculate total score
     result['total'] = result['contract_points'] + result['overtricks'] + result['bonuses'] + result['penalty']
     
-    return result
\ No newline at end of file
+    return result
+
+
+def score_many(contract_level, suit_code, doubled_code, declarer_vulnerable, tricks_made, out=None):
+    
+    """
+    Calculates the scores of many Chicago Bridge games into a plain integer matrix.
+    
+    Args:
+        contract_level, suit_code, doubled_code, declarer_vulnerable, tricks_made:
+            Arrays as for chicago_score_batch
+        out (numpy array, optional): Preallocated (n, 9) matrix to write the scores into
+        
+    Returns:
+        numpy array: One row per game, columns in the order of SCORE_FIELDS
+    """
+    
+    # Score components of all games
+    result = chicago_score_batch(contract_level, suit_code, doubled_code, declarer_vulnerable, tricks_made)
+    
+    # Allocate output only if the caller did not provide one
+    if out is None:
+        out = np.empty(result.shape + (len(SCORE_FIELDS),), dtype=SCORE_DTYPE)
+    
+    # Copy components column by column
+    for column, field in enumerate(SCORE_FIELDS):
+        out[..., column] = result[field]
+    
+    return out
+
+
+def score_batch(batch, out=None):
+    
+    """
+    Calculates the scores of all games of a DealBatch.
+    
+    Args:
+        batch (DealBatch): Inputs of the games
+        out (numpy array, optional): Preallocated (n, 9) matrix to write the scores into
+        
+    Returns:
+        numpy array: One row per game, columns in the order of SCORE_FIELDS
+    """
+    
+    return score_many(batch.levels, batch.suits, batch.doubled, batch.vulnerable, batch.tricks, out=out)